@@ -0,0 +1,192 @@
+"""Benchmarks of the bteval scorers and counters.
+
+Usage:
+    python benchmarks/bench_metrics.py --sizes 1000 100000 --save baseline.json
+    python benchmarks/bench_metrics.py --sizes 1000 100000 --compare baseline.json
+
+Peak memory is measured with tracemalloc, which accounts for Python and NumPy allocations but not
+for the ones made by torch.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import bteval
+from bteval.metrics import remove_const_text_samples
+
+SCORERS = [
+    "r1_score",
+    "r12_score",
+    "r13_score",
+    "r13p_score",
+    "r123_score",
+    "r123p_score",
+    "robustness_report",
+]
+
+COUNTERS = [
+    "c_to_i_count",
+    "i_to_i_count",
+    "i_to_c_count",
+    "changed_count",
+    "i_const_count",
+    "c_const_count",
+    "const_count",
+]
+
+LABELS = ["Inform", "Request", "Confirm", "Deny"]
+
+
+def make_data(backend, size, seed=0):
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, len(LABELS), size)
+    y_before = np.where(
+        rng.random(size) < 0.8, y_true, rng.integers(0, len(LABELS), size)
+    )
+    y_after = np.where(
+        rng.random(size) < 0.8, y_before, rng.integers(0, len(LABELS), size)
+    )
+    x_before = rng.integers(0, 1000, size).astype(str)
+    x_after = np.where(
+        rng.random(size) < 0.7, x_before, rng.integers(0, 1000, size).astype(str)
+    )
+
+    if backend == "list":
+        labels = np.asarray(LABELS)
+        columns = [labels[y].tolist() for y in (y_true, y_before, y_after)]
+        return columns + [x_before.tolist(), x_after.tolist()]
+
+    if backend == "numpy":
+        return [y_true, y_before, y_after, x_before, x_after]
+
+    if backend == "torch":
+        import torch
+
+        columns = [torch.from_numpy(y) for y in (y_true, y_before, y_after)]
+        return columns + [x_before.tolist(), x_after.tolist()]
+
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+def measure(func, repeat):
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(times), peak
+
+
+def cases(y_true, y_before, y_after, x_before, x_after, texts):
+    x = (x_before, x_after) if texts else (None, None)
+
+    for name in SCORERS:
+        func = getattr(bteval, name)
+        yield name, lambda func=func: func(
+            y_true, y_before, y_after, *x, zero_division=0.0
+        )
+
+    if texts:
+        yield "remove_const_text_samples", lambda: remove_const_text_samples(
+            y_true, y_before, y_after, x_before, x_after
+        )
+    else:
+        for name in COUNTERS:
+            func = getattr(bteval, name)
+            yield name, lambda func=func: func(y_true, y_before, y_after)
+
+
+def run(backends, sizes, repeat):
+    results = {}
+
+    for backend in backends:
+        for size in sizes:
+            columns = make_data(backend, size)
+
+            for texts in [False, True]:
+                for name, func in cases(*columns, texts=texts):
+                    key = f"{name}[{backend},{size},{'x' if texts else 'no-x'}]"
+                    seconds, peak = measure(func, repeat)
+                    results[key] = {"seconds": seconds, "peak_bytes": peak}
+                    print(
+                        f"{key:60} {seconds * 1000:12.3f} ms {peak / 2**20:10.2f} MiB"
+                    )
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+
+        ratio = result["seconds"] / max(baseline[key]["seconds"], 1e-9)
+
+        if ratio > threshold:
+            regressions.append(key)
+            print(f"REGRESSION {key}: {ratio:.2f}x slower than baseline")
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=["list", "numpy", "torch"],
+        choices=["list", "numpy", "torch"],
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[10**3, 10**4, 10**5, 10**6, 10**7]
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="timing runs per case, the best is reported",
+    )
+    parser.add_argument("--save", help="write the results to a JSON file")
+    parser.add_argument(
+        "--compare", help="compare the results with a JSON file written by --save"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="slowdown ratio reported as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.backends, args.sizes, args.repeat)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        if compare(results, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,27 @@
+from .analysis import TransitionIndex  # noqa
+from .analysis import flip_index  # noqa
+from .batch import batch_robustness_report  # noqa
+from .batch import batch_transition_counts  # noqa
+from .cache import TransitionCache  # noqa
+from .cache import use_cache  # noqa
+from .compression import collapse_samples  # noqa
+from .encoding import LabelEncoder  # noqa
+from .io import iter_batches  # noqa
+from .io import load_columns  # noqa
+from .io import load_labels  # noqa
+from .io import save_columns  # noqa
+from .metrics import C_CONST  # noqa
+from .metrics import C_TO_I  # noqa
+from .metrics import CONST_TEXT  # noqa
+from .metrics import I_CONST  # noqa
+from .metrics import I_TO_C  # noqa
+from .metrics import I_TO_I  # noqa
+from .metrics import IRRELEVANT  # noqa
+from .metrics import MEASURES  # noqa
+from .metrics import NON_ROBUST  # noqa
+from .metrics import ROBUST  # noqa
+from .metrics import TRANSITIONS  # noqa
+from .metrics import Measure  # noqa
 from .metrics import c_const_count  # noqa
 from .metrics import c_to_i_count  # noqa
 from .metrics import changed_count  # noqa
@@ -5,6 +29,7 @@ from .metrics import const_count  # noqa
 from .metrics import i_const_count  # noqa
 from .metrics import i_to_c_count  # noqa
 from .metrics import i_to_i_count  # noqa
+from .metrics import measure_score  # noqa
 from .metrics import r1_irrelevant_case  # noqa
 from .metrics import r1_non_robust_case  # noqa
 from .metrics import r1_robust_case  # noqa
@@ -28,3 +53,28 @@ from .metrics import r123_score  # noqa
 from .metrics import r123p_non_robust_case  # noqa
 from .metrics import r123p_robust_case  # noqa
 from .metrics import r123p_score  # noqa
+from .metrics import robustness_breakdown  # noqa
+from .metrics import robustness_counts  # noqa
+from .metrics import robustness_report  # noqa
+from .metrics import score_transitions  # noqa
+from .metrics import transition_case  # noqa
+from .metrics import transition_codes  # noqa
+from .metrics import transition_counts  # noqa
+from .metrics import transition_report  # noqa
+from .monitoring import DecayedRobustnessEstimator  # noqa
+from .monitoring import RobustnessWindow  # noqa
+from .parallel import parallel_file_transition_counts  # noqa
+from .parallel import parallel_robustness_report  # noqa
+from .parallel import parallel_transition_counts  # noqa
+from .profiling import StageEvent  # noqa
+from .profiling import profile_stages  # noqa
+from .reference import RobustnessReference  # noqa
+from .stats import bootstrap_robustness  # noqa
+from .stats import bootstrap_transition_counts  # noqa
+from .stats import paired_permutation_test  # noqa
+from .streaming import RobustnessAccumulator  # noqa
+from .text import TextNormalizer  # noqa
+from .wer import WER_BINS  # noqa
+from .wer import robustness_by_wer  # noqa
+from .wer import word_error_rates  # noqa
+from .wer import word_errors  # noqa
@@ -0,0 +1,120 @@
+from .metrics import CONST_TEXT, transition_codes
+
+
+def _group_indices(keys, n_keys) -> dict:
+    import numpy as np
+
+    dtype = np.int32 if len(keys) < 2**31 else np.int64
+    order = np.argsort(keys, kind="stable").astype(dtype)
+    counts = np.bincount(keys, minlength=n_keys)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+
+    return {
+        key: order[start:end]
+        for key, (start, end) in enumerate(zip(starts.tolist(), ends.tolist()))
+        if end > start
+    }
+
+
+def flip_index(
+    y_true,
+    y_before,
+    y_after_old,
+    y_after_new,
+    x_before=None,
+    x_after_old=None,
+    x_after_new=None,
+) -> dict:
+    """Indices of the samples grouped by their transition classes under two ASR revisions.
+
+    The samples are classified under both revisions and grouped with a single stable sort of the
+    (old class, new class) pairs.
+
+    Args:
+        y_true: 1d array-like.
+            The expected outcome of the NLU model (ground truth).
+
+        y_before: 1d array-like.
+            The outcome of the NLU model for the text before back transcription.
+
+        y_after_old: 1d array-like.
+            The outcome of the NLU model for the text back transcribed by the old revision.
+
+        y_after_new: 1d array-like.
+            The outcome of the NLU model for the text back transcribed by the new revision.
+
+        x_before: 1d array-like, optional.
+            Reference, i.e. the text before back transcription.
+
+        x_after_old: 1d array-like, optional.
+            Hypothesis of the old revision.
+
+        x_after_new: 1d array-like, optional.
+            Hypothesis of the new revision.
+
+    Returns:
+        index: dict
+            Maps (old class, new class) pairs to sorted integer arrays of sample indices. Classes are
+            C_CONST, I_CONST, C_TO_I, I_TO_I, I_TO_C or CONST_TEXT.
+            Only non-empty cells are included.
+    """
+    import numpy as np
+
+    old = transition_codes(y_true, y_before, y_after_old, x_before, x_after_old)
+    new = transition_codes(y_true, y_before, y_after_new, x_before, x_after_new)
+    n_classes = CONST_TEXT + 1
+    cells = old.astype(np.intp) * n_classes + new
+
+    return {
+        divmod(cell, n_classes): indices
+        for cell, indices in _group_indices(cells, n_classes**2).items()
+    }
+
+
+class TransitionIndex:
+    """Per-class access to an array of transition codes.
+
+    The indices of the samples of a class are computed on first access and cached.
+
+    Args:
+        codes: uint8 ndarray.
+            Transition codes returned by transition_codes.
+    """
+
+    def __init__(self, codes):
+        self.codes = codes
+        self._indices = {}
+
+    @classmethod
+    def from_labels(cls, y_true, y_before, y_after, x_before=None, x_after=None):
+        """Builds the index from label columns, see transition_codes."""
+
+        return cls(transition_codes(y_true, y_before, y_after, x_before, x_after))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def counts(self) -> tuple:
+        """Transition counts indexed by C_CONST, I_CONST, C_TO_I, I_TO_I and I_TO_C."""
+        import numpy as np
+
+        counts = np.bincount(self.codes, minlength=CONST_TEXT + 1)
+
+        return tuple(counts[:CONST_TEXT].tolist())
+
+    def indices(self, transition):
+        """Sorted indices of the samples of the given class (e.g. C_TO_I or CONST_TEXT)."""
+        import numpy as np
+
+        indices = self._indices.get(transition)
+
+        if indices is None:
+            indices = np.flatnonzero(self.codes == transition)
+
+            if len(self.codes) < 2**31:
+                indices = indices.astype(np.int32)
+
+            self._indices[transition] = indices
+
+        return indices
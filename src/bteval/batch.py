@@ -0,0 +1,74 @@
+from .metrics import _counts_from_masks, transition_report
+
+
+def batch_transition_counts(y_true, y_before, y_after, x_before=None, x_after=None):
+    """Counts the samples of every transition class for many systems at once.
+
+    The correctness of y_before is computed once and shared by all systems.
+
+    Args:
+        y_true: 1d array-like of shape (n_samples,).
+            The expected outcome of the NLU model (ground truth).
+
+        y_before: 1d array-like of shape (n_samples,).
+            The outcome of the NLU model for the text before back transcription.
+
+        y_after: 2d array-like of shape (n_systems, n_samples).
+            The outcome of the NLU model for the texts back transcribed by every system.
+
+        x_before: 1d array-like of shape (n_samples,), optional.
+            Reference, i.e. the text before back transcription.
+
+        x_after: 2d array-like of shape (n_systems, n_samples), optional.
+            Hypotheses, i.e. the texts back transcribed by every system.
+
+    Returns:
+        counts: ndarray of shape (n_systems, 5)
+            Transition counts of every system indexed by C_CONST, I_CONST, C_TO_I, I_TO_I and
+            I_TO_C.
+    """
+    import numpy as np
+
+    y_true = np.asarray(y_true)
+    y_before = np.asarray(y_before)
+    y_after = np.asarray(y_after)
+
+    if not y_true.shape == y_before.shape == y_after.shape[1:]:
+        raise ValueError("y_true, y_before and y_after must have the same length")
+
+    changed_text = None
+
+    if x_before is not None and x_after is not None:
+        changed_text = np.asarray(x_before) != np.asarray(x_after)
+
+    counts = _counts_from_masks(
+        y_before == y_true, y_after == y_true, y_after == y_before, changed_text
+    )
+
+    return np.stack(np.broadcast_arrays(*counts), axis=1)
+
+
+def batch_robustness_report(
+    y_true, y_before, y_after, x_before=None, x_after=None, zero_division="warn"
+) -> dict:
+    """All $R_*$ scores and *_count values for many systems at once.
+
+    See batch_transition_counts for the description of the arguments.
+
+    Returns:
+        report: dict
+            Maps the names of the score and count functions (e.g. 'r1_score', 'c_to_i_count') to
+            arrays of shape (n_systems,).
+    """
+    import numpy as np
+
+    counts = batch_transition_counts(y_true, y_before, y_after, x_before, x_after)
+    reports = [
+        transition_report(system_counts.tolist(), zero_division=zero_division)
+        for system_counts in counts
+    ]
+
+    return {
+        name: np.asarray([report[name] for report in reports])
+        for name in (reports[0] if reports else ())
+    }
@@ -0,0 +1,144 @@
+import contextlib
+import contextvars
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+_active_cache = contextvars.ContextVar("bteval_cache", default=None)
+
+_KEY_VERSION = b"bteval-transition-counts-1"
+
+
+def _update_hash(h, column):
+    if column is None:
+        h.update(b"N")
+        return
+
+    module = type(column).__module__
+
+    if module.startswith("torch"):
+        column = column.detach().cpu().numpy()
+        module = "numpy"
+
+    if module == "numpy" and column.dtype.hasobject:
+        column = column.tolist()
+    elif module == "numpy":
+        import numpy as np
+
+        column = np.ascontiguousarray(column)
+        h.update(b"A" + column.dtype.str.encode() + repr(column.shape).encode())
+        h.update(memoryview(column).cast("B"))
+        return
+
+    h.update(b"P")
+    h.update(pickle.dumps(column, protocol=4))
+
+
+class TransitionCache:
+    """Stores transition counts on the local disk, keyed by a content hash of the input columns.
+
+    Every entry is a small JSON file. When the number of entries exceeds max_entries, the least
+    recently used ones are removed. Scores are computed from the cached counts, so zero_division
+    does not affect the cache.
+
+    Args:
+        directory: str.
+            The directory that holds the entries. It is created if it does not exist.
+
+        max_entries: int, optional, default=1024.
+            The maximum number of entries.
+    """
+
+    def __init__(self, directory, max_entries=1024):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def key(
+        self, y_true, y_before, y_after, x_before=None, x_after=None, sample_weight=None
+    ) -> str:
+        """The content hash of the input columns."""
+
+        h = hashlib.blake2b(_KEY_VERSION, digest_size=16)
+
+        for column in (y_true, y_before, y_after, x_before, x_after, sample_weight):
+            _update_hash(h, column)
+
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key):
+        """The cached counts of the key or None."""
+
+        path = self._path(key)
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                counts = tuple(json.load(f))
+        except (OSError, ValueError):
+            return None
+
+        os.utime(path)
+
+        return counts
+
+    def put(self, key, counts):
+        """Stores the counts of the key and evicts the least recently used entries."""
+
+        counts = [count.item() if hasattr(count, "item") else count for count in counts]
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(counts, f)
+
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+
+            raise
+
+        self._evict()
+
+    def _evict(self):
+        entries = [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(".json")
+        ]
+
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+
+        for entry in entries[: len(entries) - self.max_entries]:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(entry.path)
+
+
+@contextlib.contextmanager
+def use_cache(cache):
+    """Caches transition counts computed by any scoring or counting function within the context.
+
+    Args:
+        cache: TransitionCache or str.
+            The cache or the directory of a cache with the default number of entries.
+
+    Yields:
+        cache: TransitionCache
+    """
+    if not isinstance(cache, TransitionCache):
+        cache = TransitionCache(cache)
+
+    token = _active_cache.set(cache)
+
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
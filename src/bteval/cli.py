@@ -0,0 +1,87 @@
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .io import iter_batches
+from .streaming import RobustnessAccumulator
+
+
+def _zero_division(value):
+    return value if value == "warn" else float(value)
+
+
+def count_file(path, columns, format=None, batch_size=65536) -> RobustnessAccumulator:
+    """Accumulates the transition counts of a JSONL or TSV file batch by batch."""
+
+    accumulator = RobustnessAccumulator()
+
+    for batch in iter_batches(path, columns, format=format, batch_size=batch_size):
+        accumulator.update(*batch)
+
+    return accumulator
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="bteval",
+        description="Computes all R* scores and *_count values for JSONL or TSV evaluation dumps.",
+    )
+    parser.add_argument("files", nargs="+", help="JSONL or TSV files to evaluate")
+    parser.add_argument("--format", choices=["jsonl", "tsv"], help="input format")
+    parser.add_argument("--y-true", default="y_true", help="ground truth column")
+    parser.add_argument(
+        "--y-before", default="y_before", help="reference outcome column"
+    )
+    parser.add_argument(
+        "--y-after", default="y_after", help="hypothesis outcome column"
+    )
+    parser.add_argument("--x-before", help="reference text column")
+    parser.add_argument("--x-after", help="hypothesis text column")
+    parser.add_argument(
+        "--batch-size", type=int, default=65536, help="records tallied at once"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="number of files processed in parallel"
+    )
+    parser.add_argument(
+        "--zero-division",
+        type=_zero_division,
+        default="warn",
+        help="value returned when a score is ill-defined ('warn' or a number)",
+    )
+    args = parser.parse_args(argv)
+
+    if (args.x_before is None) != (args.x_after is None):
+        parser.error("--x-before and --x-after must be given together")
+
+    columns = [args.y_true, args.y_before, args.y_after]
+
+    if args.x_before is not None:
+        columns += [args.x_before, args.x_after]
+
+    count = partial(
+        count_file, columns=columns, format=args.format, batch_size=args.batch_size
+    )
+    accumulator = RobustnessAccumulator()
+
+    try:
+        if args.jobs > 1:
+            with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+                for file_accumulator in executor.map(count, args.files):
+                    accumulator.merge(file_accumulator)
+        else:
+            for path in args.files:
+                accumulator.merge(count(path))
+    except ValueError as error:
+        parser.error(str(error))
+
+    json.dump(
+        accumulator.report(zero_division=args.zero_division), sys.stdout, indent=2
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import collections
+
+_LABEL_COLUMNS = ("y_true", "y_before", "y_after")
+_TEXT_COLUMNS = ("x_before", "x_after")
+
+
+def _values(column):
+    if type(column).__module__ == "numpy" or type(column).__module__.startswith(
+        "torch"
+    ):
+        return column.tolist()
+
+    return column
+
+
+def _like(column, values):
+    if type(column).__module__ == "numpy":
+        import numpy as np
+
+        return np.asarray(values, dtype=column.dtype)
+
+    if type(column).__module__.startswith("torch"):
+        import torch
+
+        return torch.tensor(values, dtype=column.dtype, device=column.device)
+
+    return list(values)
+
+
+def collapse_samples(
+    y_true, y_before, y_after, x_before=None, x_after=None, sample_weight=None
+) -> dict:
+    """Collapses duplicated samples into unique rows and their multiplicities.
+
+    Rows are grouped by hashing the (y_true, y_before, y_after, x_before, x_after) tuples, so the
+    cost is a single pass over the data. The result can be passed directly to the scoring
+    functions, e.g. robustness_report(**collapse_samples(...)), whose cost is then proportional
+    to the number of unique rows.
+
+    Args:
+        y_true: 1d array-like.
+            The expected outcome of the NLU model (ground truth).
+
+        y_before: 1d array-like.
+            The outcome of the NLU model for the text before back transcription.
+
+        y_after: 1d array-like.
+            The outcome of the NLU model for the text after back transcription.
+
+        x_before: 1d array-like, optional.
+            Reference, i.e. the text before back transcription.
+
+        x_after: 1d array-like, optional.
+            Hypothesis, i.e. the text after back transcription.
+
+        sample_weight: 1d array-like, optional.
+            Weights of the input rows, e.g. multiplicities of already collapsed logs. Defaults to 1
+            for every row.
+
+    Returns:
+        columns: dict
+            Maps y_true, y_before, y_after, x_before and x_after to the columns of the unique rows
+            in order of their first occurrence, and sample_weight to their summed weights. Columns
+            keep the type of the input (list, ndarray or tensor). Text columns are None if they
+            were not given.
+    """
+    columns = [y_true, y_before, y_after]
+    names = _LABEL_COLUMNS
+
+    if x_before is not None and x_after is not None:
+        columns += [x_before, x_after]
+        names += _TEXT_COLUMNS
+
+    rows = zip(*map(_values, columns))
+
+    if sample_weight is None:
+        weights = collections.Counter(rows)
+    else:
+        weights = collections.defaultdict(int)
+
+        for row, w in zip(rows, _values(sample_weight)):
+            weights[row] += w
+
+    unique = list(zip(*weights)) or [()] * len(columns)
+    result = dict.fromkeys(_LABEL_COLUMNS + _TEXT_COLUMNS)
+
+    for name, column, values in zip(names, columns, unique):
+        result[name] = _like(column, values)
+
+    result["sample_weight"] = _weights_like(
+        y_true if sample_weight is None else sample_weight, list(weights.values())
+    )
+
+    return result
+
+
+def _weights_like(column, values):
+    if type(column).__module__ == "numpy":
+        import numpy as np
+
+        return np.asarray(values)
+
+    if type(column).__module__.startswith("torch"):
+        import torch
+
+        return torch.tensor(values, device=column.device)
+
+    return values
@@ -0,0 +1,69 @@
+class LabelEncoder:
+    """Maps hashable labels to small integer codes.
+
+    The codes are consistent across all columns encoded with the same encoder, so they can be passed
+    to any scoring or counting function in place of the original labels. To score many hypothesis
+    sides against the same reference, encode the reference columns once with encode_reference,
+    keep the codes and encode only y_after for every hypothesis side.
+    """
+
+    def __init__(self):
+        self.classes = []
+        self._codes = {}
+
+    def _code(self, label) -> int:
+        code = self._codes.get(label)
+
+        if code is None:
+            code = self._codes[label] = len(self.classes)
+            self.classes.append(label)
+
+        return code
+
+    def transform(self, labels):
+        """Encodes a column of labels as an int32 array of the same shape.
+
+        Labels that were not seen before are assigned new codes. 2d inputs (e.g. y_after of
+        batch_transition_counts) are encoded element-wise.
+        """
+        import numpy as np
+
+        if type(labels).__module__.startswith(("numpy", "torch")):
+            if type(labels).__module__.startswith("torch"):
+                labels = labels.cpu()
+
+            labels = np.asarray(labels)
+            uniques, inverse = np.unique(labels, return_inverse=True)
+            mapping = np.fromiter(
+                (self._code(label) for label in uniques.tolist()),
+                dtype=np.int32,
+                count=len(uniques),
+            )
+
+            return mapping[inverse.reshape(-1)].reshape(labels.shape)
+
+        labels = list(labels)
+
+        if labels and isinstance(labels[0], list):
+            return np.stack([self.transform(row) for row in labels])
+
+        return np.fromiter((self._code(label) for label in labels), dtype=np.int32)
+
+    def encode_reference(self, y_true, y_before) -> tuple:
+        """Encodes the columns that do not depend on the ASR system.
+
+        The returned codes stay valid for all later calls of transform, so they can be reused for
+        every hypothesis side, e.g. r1_score(*reference, encoder.transform(y_after)).
+        """
+
+        return self.transform(y_true), self.transform(y_before)
+
+    def encode(self, y_true, y_before, y_after) -> tuple:
+        """Encodes y_true, y_before and y_after with a shared set of codes."""
+
+        return self.transform(y_true), self.transform(y_before), self.transform(y_after)
+
+    def inverse_transform(self, codes) -> list:
+        """Decodes an array of codes back to labels."""
+
+        return [self.classes[code] for code in codes]
@@ -0,0 +1,140 @@
+import json
+import os
+
+from .encoding import LabelEncoder
+from .text import TextNormalizer
+
+_LABEL_COLUMNS = ("y_true", "y_before", "y_after")
+_TEXT_COLUMNS = ("x_before", "x_after")
+
+
+def save_columns(
+    directory,
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    encoder=None,
+    normalizer=None,
+):
+    """Stores evaluation data as integer-coded .npy columns.
+
+    Labels are encoded with encoder and texts are stored as 64-bit digests computed by normalizer.
+    The label vocabulary is saved to labels.json.
+
+    Args:
+        directory: str.
+            The directory to write the columns to. It is created if it does not exist.
+
+        encoder: LabelEncoder, optional.
+            The encoder of the labels. Defaults to a new LabelEncoder.
+
+        normalizer: TextNormalizer, optional.
+            The normalizer used to compute text digests. Defaults to a TextNormalizer that leaves
+            the texts unchanged.
+    """
+    import numpy as np
+
+    encoder = encoder or LabelEncoder()
+    normalizer = normalizer or TextNormalizer(
+        lowercase=False, strip_punctuation=False, collapse_whitespace=False
+    )
+
+    os.makedirs(directory, exist_ok=True)
+
+    for name, labels in zip(_LABEL_COLUMNS, (y_true, y_before, y_after)):
+        np.save(os.path.join(directory, name + ".npy"), encoder.transform(labels))
+
+    if x_before is not None and x_after is not None:
+        for name, texts in zip(_TEXT_COLUMNS, (x_before, x_after)):
+            digests = np.fromiter(map(normalizer.digest, texts), dtype=np.int64)
+            np.save(os.path.join(directory, name + ".npy"), digests)
+
+    with open(os.path.join(directory, "labels.json"), "w", encoding="utf-8") as f:
+        json.dump(encoder.classes, f)
+
+
+def load_columns(directory, mmap_mode="r") -> dict:
+    """Loads the columns stored by save_columns as memory-mapped arrays.
+
+    The result can be passed directly to the scoring functions, e.g. r123_score(**columns).
+
+    Returns:
+        columns: dict
+            Maps y_true, y_before, y_after, x_before and x_after to arrays. Text columns are None
+            if they were not stored.
+    """
+    import numpy as np
+
+    columns = {}
+
+    for name in _LABEL_COLUMNS + _TEXT_COLUMNS:
+        path = os.path.join(directory, name + ".npy")
+        columns[name] = (
+            np.load(path, mmap_mode=mmap_mode) if os.path.exists(path) else None
+        )
+
+    return columns
+
+
+def load_labels(directory) -> list:
+    """Loads the label vocabulary stored by save_columns, indexed by label code."""
+
+    with open(os.path.join(directory, "labels.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _open_records(path, format):
+    import csv
+
+    with open(path, encoding="utf-8", newline="") as f:
+        if format == "tsv":
+            yield from csv.DictReader(f, delimiter="\t", quoting=csv.QUOTE_NONE)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def iter_batches(path, columns, format=None, batch_size=65536):
+    """Streams batches of columns from a JSONL or TSV file.
+
+    Args:
+        path: str.
+            The file to read. TSV files must have a header row.
+
+        columns: list of str.
+            The names of the fields to extract from every record.
+
+        format: str, optional.
+            Either 'jsonl' or 'tsv'. Defaults to 'tsv' for files with the .tsv extension and to
+            'jsonl' otherwise.
+
+        batch_size: int, optional, default=65536.
+            The number of records in a batch.
+
+    Yields:
+        batch: tuple of lists, one list per column.
+
+    Raises:
+        ValueError: if a record has no field of one of the columns.
+    """
+    if format is None:
+        format = "tsv" if path.endswith(".tsv") else "jsonl"
+
+    batch = tuple([] for _ in columns)
+
+    for record in _open_records(path, format):
+        for values, name in zip(batch, columns):
+            try:
+                values.append(record[name])
+            except KeyError:
+                raise ValueError(f"{path}: missing column {name!r}") from None
+
+        if len(batch[0]) == batch_size:
+            yield batch
+            batch = tuple([] for _ in columns)
+
+    if batch[0]:
+        yield batch
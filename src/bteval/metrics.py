@@ -1,7 +1,124 @@
+import itertools
+import time
 import warnings
 
+from .cache import _active_cache
+from .profiling import _emit, _stage_callback, _StageTimer
 
-def aggregate_robustness(robust: int, non_robust: int, zero_division) -> float:
+C_CONST = 0
+I_CONST = 1
+C_TO_I = 2
+I_TO_I = 3
+I_TO_C = 4
+
+TRANSITIONS = ("constC", "constI", "C->I", "I->I", "I->C")
+
+CONST_TEXT = 5
+
+_CHUNK_SIZE = 1 << 20
+
+ROBUST = "robust"
+NON_ROBUST = "non-robust"
+IRRELEVANT = "irrelevant"
+
+_OUTCOME_CODES = {ROBUST: 1, NON_ROBUST: -1, IRRELEVANT: 0}
+
+
+class Measure:
+    """A robustness measure defined by the outcome of every transition class.
+
+    The definition is compiled into a lookup table indexed by transition class, so custom measures
+    are scored from transition counts or per-sample transition codes exactly like the built-in ones.
+
+    Args:
+        outcomes: dict.
+            Maps transition classes (C_CONST, I_CONST, C_TO_I, I_TO_I, I_TO_C or their names from
+            TRANSITIONS, e.g. 'C->I') to ROBUST, NON_ROBUST or IRRELEVANT. Classes that are not
+            mentioned are irrelevant.
+    """
+
+    def __init__(self, outcomes):
+        table = [0, 0, 0, 0, 0]
+
+        for transition, outcome in outcomes.items():
+            if transition in TRANSITIONS:
+                transition = TRANSITIONS.index(transition)
+
+            if transition not in range(5):
+                raise ValueError(f"Unknown transition class: {transition!r}")
+
+            if outcome not in _OUTCOME_CODES:
+                raise ValueError(f"Unknown outcome: {outcome!r}")
+
+            table[transition] = _OUTCOME_CODES[outcome]
+
+        self.table = tuple(table)
+        self.robust = tuple(c for c, code in enumerate(table) if code == 1)
+        self.non_robust = tuple(c for c, code in enumerate(table) if code == -1)
+
+    def __repr__(self):
+        outcomes = {
+            TRANSITIONS[c]: outcome
+            for c, code in enumerate(self.table)
+            for outcome, outcome_code in _OUTCOME_CODES.items()
+            if code == outcome_code and code != 0
+        }
+
+        return f"Measure({outcomes!r})"
+
+    def robustness_counts(self, counts) -> tuple:
+        """Splits transition counts into robust and non-robust cases."""
+
+        return (
+            sum(counts[c] for c in self.robust),
+            sum(counts[c] for c in self.non_robust),
+        )
+
+    def outcomes(self, codes):
+        """Maps an array of transition codes to 1 (robust), -1 (non-robust) or 0 (irrelevant)."""
+        import numpy as np
+
+        return np.asarray(self.table, dtype=np.int8)[codes]
+
+    def robust_case(self, y_true, y_before, y_after) -> bool:
+        return self.table[transition_case(y_true, y_before, y_after)] == 1
+
+    def non_robust_case(self, y_true, y_before, y_after) -> bool:
+        return self.table[transition_case(y_true, y_before, y_after)] == -1
+
+    def irrelevant_case(self, y_true, y_before, y_after) -> bool:
+        return self.table[transition_case(y_true, y_before, y_after)] == 0
+
+
+MEASURES = {
+    "r1": Measure({C_CONST: ROBUST, C_TO_I: NON_ROBUST}),
+    "r12": Measure(
+        {C_CONST: ROBUST, I_CONST: ROBUST, C_TO_I: NON_ROBUST, I_TO_I: NON_ROBUST}
+    ),
+    "r13": Measure({C_CONST: ROBUST, C_TO_I: NON_ROBUST, I_TO_C: NON_ROBUST}),
+    "r13p": Measure({C_CONST: ROBUST, I_TO_C: ROBUST, C_TO_I: NON_ROBUST}),
+    "r123": Measure(
+        {
+            C_CONST: ROBUST,
+            I_CONST: ROBUST,
+            C_TO_I: NON_ROBUST,
+            I_TO_I: NON_ROBUST,
+            I_TO_C: NON_ROBUST,
+        }
+    ),
+    "r123p": Measure(
+        {
+            C_CONST: ROBUST,
+            I_CONST: ROBUST,
+            I_TO_C: ROBUST,
+            C_TO_I: NON_ROBUST,
+            I_TO_I: NON_ROBUST,
+        }
+    ),
+}
+
+
+def aggregate_robustness(robust: float, non_robust: float, zero_division) -> float:
     """Aggregates robust and non-robust cases."""
 
     try:
@@ -14,12 +131,22 @@ def aggregate_robustness(robust: int, non_robust: int, zero_division) -> float:
         return zero_division
 
 
-def remove_const_text_samples(y_true, y_before, y_after, x_before, x_after):
-    "Remove samples where reference and back transcribed texts are the same."
+def remove_const_text_samples(
+    y_true, y_before, y_after, x_before, x_after, normalizer=None
+):
+    """Remove samples where reference and back transcribed texts are the same.
+
+    If normalizer (e.g. a TextNormalizer) is given, the texts are compared through the digests of
+    their normalized forms.
+    """
 
     if x_before is None or x_after is None:
         return y_true, y_before, y_after
 
+    if normalizer is not None:
+        x_before = map(normalizer.digest, x_before)
+        x_after = map(normalizer.digest, x_after)
+
     res_true = []
     res_before = []
     res_after = []
@@ -42,23 +169,733 @@ def score_robustness(
     x_before,
     x_after,
     zero_division,
+    sample_weight=None,
+    normalizer=None,
 ) -> float:
-    """Scores robustness in accordance with robust_case_func and non_robust_case_func."""
+    """Scores robustness in accordance with robust_case_func and non_robust_case_func.
 
-    y_true, y_before, y_after = remove_const_text_samples(
-        y_true, y_before, y_after, x_before, x_after
-    )
+    If sample_weight is given, every sample contributes its weight (e.g. its multiplicity)
+    instead of 1. If normalizer is given, texts are compared as in remove_const_text_samples.
+    """
+
+    callback = _stage_callback.get()
+
+    if callback is not None:
+        start = time.perf_counter()
+        n_samples = len(y_true)
+
+    if sample_weight is None:
+        y_true, y_before, y_after = remove_const_text_samples(
+            y_true, y_before, y_after, x_before, x_after, normalizer
+        )
+        sample_weight = itertools.repeat(1)
+    elif x_before is not None and x_after is not None:
+        if normalizer is not None:
+            x_before = map(normalizer.digest, x_before)
+            x_after = map(normalizer.digest, x_after)
+
+        changed_text = [xb != xa for xb, xa in zip(x_before, x_after)]
+        y_true = list(itertools.compress(y_true, changed_text))
+        y_before = list(itertools.compress(y_before, changed_text))
+        y_after = list(itertools.compress(y_after, changed_text))
+        sample_weight = itertools.compress(sample_weight, changed_text)
+
+    if callback is not None:
+        start = _emit(callback, "filter", start, len(y_true), n_samples - len(y_true))
 
     robust = 0
     non_robust = 0
 
-    for t, b, a in zip(y_true, y_before, y_after):
+    for t, b, a, w in zip(y_true, y_before, y_after, sample_weight):
         if robust_case_func(t, b, a):
-            robust += 1
+            robust += w
         elif non_robust_case_func(t, b, a):
-            non_robust += 1
+            non_robust += w
+
+    if callback is not None:
+        start = _emit(callback, "tally", start, len(y_true), 0)
+
+    score = aggregate_robustness(robust, non_robust, zero_division=zero_division)
+
+    if callback is not None:
+        _emit(callback, "aggregate", start, robust + non_robust, 0)
+
+    return score
+
+
+def transition_counts(
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    sample_weight=None,
+    normalizer=None,
+) -> tuple:
+    """Counts the samples of every transition class in a single pass.
+
+    Samples whose reference and back transcribed texts are the same are skipped if x_before and
+    x_after are given. If normalizer (e.g. a TextNormalizer) is given, the texts are compared
+    through the digests of their normalized forms. If sample_weight is given, every sample
+    contributes its weight (e.g. its multiplicity) instead of 1.
+
+    Returns:
+        counts: tuple of numbers indexed by C_CONST, I_CONST, C_TO_I, I_TO_I and I_TO_C.
+    """
+    if normalizer is not None and x_before is not None and x_after is not None:
+        x_before = normalizer.digests(x_before)
+        x_after = normalizer.digests(x_after)
+
+    cache = _active_cache.get()
+
+    if cache is not None:
+        key = cache.key(y_true, y_before, y_after, x_before, x_after, sample_weight)
+        counts = cache.get(key)
+
+        if counts is None:
+            counts = _dispatch_transition_counts(
+                y_true, y_before, y_after, x_before, x_after, sample_weight
+            )
+            cache.put(key, counts)
+
+        return counts
+
+    return _dispatch_transition_counts(
+        y_true, y_before, y_after, x_before, x_after, sample_weight
+    )
+
+
+def _dispatch_transition_counts(
+    y_true, y_before, y_after, x_before, x_after, sample_weight=None
+) -> tuple:
+    callback = _stage_callback.get()
+
+    if callback is None:
+        return _transition_counts(
+            y_true, y_before, y_after, x_before, x_after, sample_weight
+        )
+
+    timer = _StageTimer(callback)
+    counts = _transition_counts(
+        y_true, y_before, y_after, x_before, x_after, sample_weight, timer
+    )
+    timer.emit()
+
+    return counts
+
+
+def _transition_counts(
+    y_true, y_before, y_after, x_before, x_after, sample_weight=None, timer=None
+) -> tuple:
+    if _is_tensor(y_true, y_before, y_after):
+        return _torch_transition_counts(
+            y_true, y_before, y_after, x_before, x_after, sample_weight, timer
+        )
+
+    if _is_ndarray(y_true, y_before, y_after):
+        return _numpy_transition_counts(
+            y_true, y_before, y_after, x_before, x_after, sample_weight, timer
+        )
+
+    if timer is not None:
+        timer.lap("convert", len(y_true))
+
+    counts = [0, 0, 0, 0, 0]
+    n_kept = len(y_true)
+
+    if sample_weight is not None:
+        if x_before is None or x_after is None:
+            for t, b, a, w in zip(y_true, y_before, y_after, sample_weight):
+                counts[transition_case(t, b, a)] += w
+        else:
+            n_kept = 0
+
+            for t, b, a, xb, xa, w in zip(
+                y_true, y_before, y_after, x_before, x_after, sample_weight
+            ):
+                if xb != xa:
+                    counts[transition_case(t, b, a)] += w
+                    n_kept += 1
+    elif x_before is None or x_after is None:
+        for t, b, a in zip(y_true, y_before, y_after):
+            counts[transition_case(t, b, a)] += 1
+    else:
+        for t, b, a, xb, xa in zip(y_true, y_before, y_after, x_before, x_after):
+            if xb != xa:
+                counts[transition_case(t, b, a)] += 1
+
+        n_kept = sum(counts)
+
+    if timer is not None:
+        timer.lap("tally", n_kept)
+        timer.lap("filter", n_kept, len(y_true) - n_kept)
+
+    return tuple(counts)
+
+
+def _is_ndarray(*columns) -> bool:
+    return any(type(column).__module__ == "numpy" for column in columns)
+
+
+def _numpy_columns(y_true, y_before, y_after) -> tuple:
+    import numpy as np
+
+    y_true = np.asarray(y_true)
+    y_before = np.asarray(y_before)
+    y_after = np.asarray(y_after)
+
+    if not y_true.shape == y_before.shape == y_after.shape:
+        raise ValueError("y_true, y_before and y_after must have the same length")
+
+    if y_true.ndim != 1:
+        raise ValueError("y_true, y_before and y_after must be 1d")
+
+    return y_true, y_before, y_after
+
+
+def _numpy_transition_counts(
+    y_true, y_before, y_after, x_before, x_after, sample_weight=None, timer=None
+) -> tuple:
+    import numpy as np
+
+    y_true, y_before, y_after = _numpy_columns(y_true, y_before, y_after)
+
+    if x_before is None or x_after is None:
+        x_before = x_after = None
+    else:
+        x_before = np.asarray(x_before)
+        x_after = np.asarray(x_after)
+
+    if sample_weight is not None:
+        sample_weight = np.asarray(sample_weight)
+
+        if sample_weight.shape != y_true.shape:
+            raise ValueError("sample_weight must have the same length as y_true")
+
+    if timer is not None:
+        timer.lap("convert", len(y_true))
+
+    counts = [0, 0, 0, 0, 0]
+
+    for start in range(0, len(y_true), _CHUNK_SIZE):
+        chunk = slice(start, start + _CHUNK_SIZE)
+        chunk_counts = _numpy_chunk_counts(
+            y_true[chunk],
+            y_before[chunk],
+            y_after[chunk],
+            None if x_before is None else x_before[chunk],
+            None if x_after is None else x_after[chunk],
+            None if sample_weight is None else sample_weight[chunk],
+            timer,
+        )
+
+        for i, count in enumerate(chunk_counts):
+            counts[i] += count
+
+    return tuple(counts)
+
+
+def _numpy_chunk_counts(
+    y_true, y_before, y_after, x_before, x_after, sample_weight, timer=None
+) -> tuple:
+    changed_text = None if x_before is None else x_before != x_after
+
+    if timer is not None:
+        n_kept = _lap_filter(timer, len(y_true), changed_text)
+
+    counts = _counts_from_masks(
+        y_before == y_true,
+        y_after == y_true,
+        y_before == y_after,
+        changed_text,
+        sample_weight,
+    )
+
+    if timer is not None:
+        timer.lap("tally", n_kept)
+
+    return counts
+
+
+def _lap_filter(timer, n_samples, changed_text):
+    n_kept = n_samples if changed_text is None else int(changed_text.sum())
+    timer.lap("filter", n_kept, n_samples - n_kept)
+
+    return n_kept
+
+
+def _counts_from_masks(
+    correct_before, correct_after, const, changed_text=None, sample_weight=None
+) -> tuple:
+    if sample_weight is not None:
+        return _weighted_counts_from_masks(
+            correct_before, correct_after, const, changed_text, sample_weight
+        )
+
+    if changed_text is not None:
+        correct_before = correct_before & changed_text
+        correct_after = correct_after & changed_text
+        const = const & changed_text
+        total = changed_text.sum(-1)
+    else:
+        total = correct_after.shape[-1]
+
+    c_const = (correct_before & correct_after).sum(-1)
+    c_to_i = correct_before.sum(-1) - c_const
+    i_to_c = correct_after.sum(-1) - c_const
+    i_const = (const & ~(correct_before | correct_after)).sum(-1)
+    i_to_i = total - c_const - c_to_i - i_to_c - i_const
+    counts = (c_const, i_const, c_to_i, i_to_i, i_to_c)
+
+    return _counts_tuple(counts)
+
+
+def _weighted_counts_from_masks(
+    correct_before, correct_after, const, changed_text, sample_weight
+) -> tuple:
+    # Every class is summed separately, so that rounding errors of float weights
+    # do not leave residues in classes without samples.
+    if changed_text is not None:
+        sample_weight = sample_weight * changed_text
+
+    incorrect = ~(correct_before | correct_after)
+    masks = (
+        correct_before & correct_after,
+        const & incorrect,
+        correct_before & ~correct_after,
+        ~const & incorrect,
+        correct_after & ~correct_before,
+    )
+
+    return _counts_tuple(tuple((sample_weight * mask).sum(-1) for mask in masks))
+
+
+def _counts_tuple(counts) -> tuple:
+    if _is_tensor(*counts):
+        import torch
+
+        device = next(count.device for count in counts if _is_tensor(count))
+
+        return tuple(
+            torch.stack([torch.as_tensor(c, device=device) for c in counts]).tolist()
+        )
+
+    if all(getattr(count, "ndim", 0) == 0 for count in counts):
+        return tuple(
+            count.item() if hasattr(count, "item") else count for count in counts
+        )
+
+    return counts
+
+
+def _is_tensor(*columns) -> bool:
+    return any(type(column).__module__.startswith("torch") for column in columns)
+
+
+def _torch_labels(column, device):
+    import torch
+
+    column = torch.as_tensor(column, device=device)
+
+    if column.is_floating_point() and column.dim() == 2:
+        return column.argmax(dim=-1)
+
+    return column
+
+
+def _torch_columns(y_true, y_before, y_after) -> tuple:
+    import torch
+
+    device = next(
+        column.device for column in (y_true, y_before, y_after) if _is_tensor(column)
+    )
+
+    y_true = torch.as_tensor(y_true, device=device)
+    y_before = _torch_labels(y_before, device)
+    y_after = _torch_labels(y_after, device)
+
+    if not y_true.shape == y_before.shape == y_after.shape:
+        raise ValueError("y_true, y_before and y_after must have the same length")
+
+    return y_true, y_before, y_after
+
+
+def _torch_changed_text(x_before, x_after, device):
+    import torch
+
+    if _is_tensor(x_before, x_after):
+        return torch.as_tensor(x_before, device=device) != torch.as_tensor(
+            x_after, device=device
+        )
+
+    if _is_ndarray(x_before, x_after):
+        import numpy as np
+
+        changed_text = np.asarray(x_before) != np.asarray(x_after)
+
+        return torch.from_numpy(changed_text).to(device)
+
+    return torch.tensor(
+        [xb != xa for xb, xa in zip(x_before, x_after)],
+        dtype=torch.bool,
+        device=device,
+    )
+
+
+def _torch_transition_counts(
+    y_true, y_before, y_after, x_before, x_after, sample_weight=None, timer=None
+) -> tuple:
+    import torch
+
+    y_true, y_before, y_after = _torch_columns(y_true, y_before, y_after)
+
+    if sample_weight is not None:
+        sample_weight = torch.as_tensor(sample_weight, device=y_true.device)
+
+        if sample_weight.shape != y_true.shape:
+            raise ValueError("sample_weight must have the same length as y_true")
+
+    if timer is not None:
+        timer.lap("convert", len(y_true))
+
+    changed_text = None
+
+    if x_before is not None and x_after is not None:
+        changed_text = _torch_changed_text(x_before, x_after, y_true.device)
+
+    if timer is not None:
+        n_kept = _lap_filter(timer, len(y_true), changed_text)
+
+    counts = _counts_from_masks(
+        y_before == y_true,
+        y_after == y_true,
+        y_before == y_after,
+        changed_text,
+        sample_weight,
+    )
+
+    if timer is not None:
+        timer.lap("tally", n_kept)
+
+    return counts
+
+
+def robustness_counts(measure, counts) -> tuple:
+    """Splits transition counts into robust and non-robust cases of the given measure.
+
+    The measure is either a Measure or the name of a built-in measure (e.g. 'r13').
+    """
+
+    if not isinstance(measure, Measure):
+        measure = MEASURES[measure]
+
+    return measure.robustness_counts(counts)
+
+
+def score_transitions(measure, counts, zero_division="warn") -> float:
+    """Scores robustness of the given measure (a Measure or a name, e.g. 'r13') from transition counts."""
+
+    callback = _stage_callback.get()
+
+    if callback is not None:
+        start = time.perf_counter()
+
+    robust, non_robust = robustness_counts(measure, counts)
+    score = aggregate_robustness(robust, non_robust, zero_division=zero_division)
+
+    if callback is not None:
+        _emit(callback, "aggregate", start, robust + non_robust, 0)
+
+    return score
+
+
+def transition_report(counts, zero_division="warn") -> dict:
+    """Derives all $R_*$ scores and *_count values from transition counts."""
+
+    report = {
+        measure
+        + "_score": score_transitions(measure, counts, zero_division=zero_division)
+        for measure in MEASURES
+    }
 
-    return aggregate_robustness(robust, non_robust, zero_division=zero_division)
+    report["c_to_i_count"] = counts[C_TO_I]
+    report["i_to_i_count"] = counts[I_TO_I]
+    report["i_to_c_count"] = counts[I_TO_C]
+    report["changed_count"] = counts[C_TO_I] + counts[I_TO_I] + counts[I_TO_C]
+    report["i_const_count"] = counts[I_CONST]
+    report["c_const_count"] = counts[C_CONST]
+    report["const_count"] = counts[C_CONST] + counts[I_CONST]
+
+    return report
+
+
+def robustness_report(
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    zero_division="warn",
+    sample_weight=None,
+    normalizer=None,
+) -> dict:
+    """All $R_*$ scores and *_count values computed in a single pass over the data.
+
+    Args:
+        y_true: 1d array-like.
+            The expected outcome of the NLU model (ground truth).
+
+        y_before: 1d array-like.
+            The outcome of the NLU model for the text before back transcription.
+
+        y_after: 1d array-like.
+            The outcome of the NLU model for the text after back transcription.
+
+        x_before: 1d array-like, optional.
+            Reference, i.e. the text before back transcription.
+
+        x_after: 1d array-like, optional.
+            Hypothesis, i.e. the text after back transcription.
+
+        zero_division: str or float, optional, default='warn'.
+            Sets the value to return when there is a zero division.
+
+        sample_weight: 1d array-like, optional.
+            Weights of the samples, e.g. the multiplicities returned by collapse_samples.
+
+        normalizer: TextNormalizer, optional.
+            If given, texts are compared through the digests of their normalized forms.
+
+    Returns:
+        report: dict
+            Maps the names of the score and count functions (e.g. 'r1_score', 'c_to_i_count') to
+            their values. If x_before and x_after are given, the counts are computed over the
+            samples that remain after removing the ones with unchanged texts.
+    """
+    counts = transition_counts(
+        y_true, y_before, y_after, x_before, x_after, sample_weight, normalizer
+    )
+
+    return transition_report(counts, zero_division=zero_division)
+
+
+def measure_score(
+    measure,
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    zero_division="warn",
+    sample_weight=None,
+) -> float:
+    """Scores robustness of a custom measure.
+
+    Args:
+        measure: Measure or str.
+            The measure or the name of a built-in measure (e.g. 'r13').
+
+    See robustness_report for the description of the remaining arguments.
+
+    Returns:
+        score: float
+    """
+    return score_transitions(
+        measure,
+        transition_counts(y_true, y_before, y_after, x_before, x_after, sample_weight),
+        zero_division=zero_division,
+    )
+
+
+def _numpy_transition_codes(y_true, y_before, y_after):
+    return _codes_from_masks(y_before == y_true, y_after == y_true, y_before == y_after)
+
+
+def _codes_from_masks(correct_before, correct_after, const):
+    import numpy as np
+
+    codes = np.full(len(correct_before), I_TO_I, dtype=np.uint8)
+    codes[const] = I_CONST
+    codes[correct_after] = I_TO_C
+    codes[correct_before] = C_TO_I
+    codes[correct_before & correct_after] = C_CONST
+
+    return codes
+
+
+def transition_codes(y_true, y_before, y_after, x_before=None, x_after=None):
+    """The transition class of every sample as a compact array.
+
+    Args:
+        y_true: 1d array-like.
+            The expected outcome of the NLU model (ground truth).
+
+        y_before: 1d array-like.
+            The outcome of the NLU model for the text before back transcription.
+
+        y_after: 1d array-like.
+            The outcome of the NLU model for the text after back transcription.
+
+        x_before: 1d array-like, optional.
+            Reference, i.e. the text before back transcription.
+
+        x_after: 1d array-like, optional.
+            Hypothesis, i.e. the text after back transcription.
+
+    Returns:
+        codes: uint8 ndarray
+            C_CONST, I_CONST, C_TO_I, I_TO_I or I_TO_C for every sample, or CONST_TEXT for the
+            samples whose reference and back transcribed texts are the same.
+    """
+    import numpy as np
+
+    if _is_tensor(y_true, y_before, y_after):
+        y_true, y_before, y_after = _torch_columns(y_true, y_before, y_after)
+        codes = _codes_from_masks(
+            (y_before == y_true).cpu().numpy(),
+            (y_after == y_true).cpu().numpy(),
+            (y_before == y_after).cpu().numpy(),
+        )
+    elif _is_ndarray(y_true, y_before, y_after):
+        y_true, y_before, y_after = _numpy_columns(y_true, y_before, y_after)
+        codes = _numpy_transition_codes(y_true, y_before, y_after)
+    else:
+        codes = np.frombuffer(
+            bytearray(
+                transition_case(t, b, a) for t, b, a in zip(y_true, y_before, y_after)
+            ),
+            dtype=np.uint8,
+        )
+
+    if x_before is not None and x_after is not None:
+        if _is_tensor(x_before, x_after):
+            device = next(x.device for x in (x_before, x_after) if _is_tensor(x))
+            const_text = ~_torch_changed_text(x_before, x_after, device).cpu().numpy()
+        elif _is_ndarray(x_before, x_after):
+            const_text = ~(np.asarray(x_before) != np.asarray(x_after))
+        else:
+            const_text = np.fromiter(
+                (not xb != xa for xb, xa in zip(x_before, x_after)),
+                dtype=bool,
+                count=len(codes),
+            )
+
+        codes[const_text] = CONST_TEXT
+
+    return codes
+
+
+def _numpy_group_counts(
+    y_true, y_before, y_after, groups, x_before, x_after, sample_weight
+) -> dict:
+    import numpy as np
+
+    y_true = np.asarray(y_true)
+    y_before = np.asarray(y_before)
+    y_after = np.asarray(y_after)
+    keys, group_ids = np.unique(np.asarray(groups), return_inverse=True)
+    group_ids = group_ids.reshape(-1)
+
+    if not y_true.shape == y_before.shape == y_after.shape == group_ids.shape:
+        raise ValueError(
+            "y_true, y_before, y_after and groups must have the same length"
+        )
+
+    if sample_weight is not None:
+        sample_weight = np.asarray(sample_weight)
+
+        if sample_weight.shape != y_true.shape:
+            raise ValueError("sample_weight must have the same length as y_true")
+
+    if x_before is not None and x_after is not None:
+        changed_text = np.asarray(x_before) != np.asarray(x_after)
+        y_true = y_true[changed_text]
+        y_before = y_before[changed_text]
+        y_after = y_after[changed_text]
+        group_ids = group_ids[changed_text]
+
+        if sample_weight is not None:
+            sample_weight = sample_weight[changed_text]
+
+    codes = _numpy_transition_codes(y_true, y_before, y_after)
+    counts = np.bincount(
+        group_ids * 5 + codes, weights=sample_weight, minlength=len(keys) * 5
+    )
+
+    if sample_weight is not None and sample_weight.dtype.kind in "biu":
+        counts = counts.astype(np.int64)
+
+    return dict(zip(keys.tolist(), counts.reshape(-1, 5).tolist()))
+
+
+def robustness_breakdown(
+    y_true,
+    y_before,
+    y_after,
+    groups,
+    x_before=None,
+    x_after=None,
+    zero_division="warn",
+    sample_weight=None,
+) -> dict:
+    """All $R_*$ scores and *_count values for every group of samples, computed in a single pass.
+
+    Args:
+        y_true: 1d array-like.
+            The expected outcome of the NLU model (ground truth).
+
+        y_before: 1d array-like.
+            The outcome of the NLU model for the text before back transcription.
+
+        y_after: 1d array-like.
+            The outcome of the NLU model for the text after back transcription.
+
+        groups: 1d array-like.
+            The group (e.g. intent, domain or locale) of every sample.
+
+        x_before: 1d array-like, optional.
+            Reference, i.e. the text before back transcription.
+
+        x_after: 1d array-like, optional.
+            Hypothesis, i.e. the text after back transcription.
+
+        zero_division: str or float, optional, default='warn'.
+            Sets the value to return when there is a zero division.
+
+        sample_weight: 1d array-like, optional.
+            Weights of the samples. Defaults to 1 for every sample.
+
+    Returns:
+        breakdown: dict
+            Maps every group to the report returned by robustness_report for its samples.
+    """
+    if _is_ndarray(y_true, y_before, y_after, groups):
+        group_counts = _numpy_group_counts(
+            y_true, y_before, y_after, groups, x_before, x_after, sample_weight
+        )
+    else:
+        group_counts = {}
+
+        if sample_weight is None:
+            sample_weight = itertools.repeat(1)
+
+        if x_before is None or x_after is None:
+            for t, b, a, g, w in zip(y_true, y_before, y_after, groups, sample_weight):
+                counts = group_counts.setdefault(g, [0, 0, 0, 0, 0])
+                counts[transition_case(t, b, a)] += w
+        else:
+            for t, b, a, g, xb, xa, w in zip(
+                y_true, y_before, y_after, groups, x_before, x_after, sample_weight
+            ):
+                counts = group_counts.setdefault(g, [0, 0, 0, 0, 0])
+
+                if xb != xa:
+                    counts[transition_case(t, b, a)] += w
+
+    return {
+        group: transition_report(counts, zero_division=zero_division)
+        for group, counts in group_counts.items()
+    }
 
 
 def c_const_case(y_true, y_before, y_after) -> bool:
@@ -89,6 +926,18 @@ def changed_case(y_true, y_before, y_after) -> bool:
     return y_before != y_after
 
 
+def transition_case(y_true, y_before, y_after) -> int:
+    """The transition class (C_CONST, I_CONST, C_TO_I, I_TO_I or I_TO_C) of a single sample."""
+
+    if y_before == y_true:
+        return C_CONST if y_after == y_true else C_TO_I
+
+    if y_after == y_true:
+        return I_TO_C
+
+    return I_CONST if y_before == y_after else I_TO_I
+
+
 def r1_robust_case(y_true, y_before, y_after) -> bool:
     return c_const_case(y_true, y_before, y_after)
 
@@ -106,7 +955,13 @@ def r1_irrelevant_case(y_true, y_before, y_after) -> bool:
 
 
 def r1_score(
-    y_true, y_before, y_after, x_before=None, x_after=None, zero_division="warn"
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    zero_division="warn",
+    sample_weight=None,
 ) -> float:
     """The $R_1$ score.
 
@@ -133,6 +988,9 @@ def r1_score(
         zero_division: str or float, optional, default='warn'.
             Sets the value to return when there is a zero division.
 
+        sample_weight: 1d array-like, optional.
+            Weights of the samples. Defaults to 1 for every sample.
+
     Returns:
         score: float
 
@@ -143,14 +1001,9 @@ def r1_score(
 
         irrelevant cases: constI, I->I, I->C
     """
-    return score_robustness(
-        r1_robust_case,
-        r1_non_robust_case,
-        y_true,
-        y_before,
-        y_after,
-        x_before,
-        x_after,
+    return score_transitions(
+        "r1",
+        transition_counts(y_true, y_before, y_after, x_before, x_after, sample_weight),
         zero_division=zero_division,
     )
 
@@ -172,7 +1025,13 @@ def r13_irrelevant_case(y_true, y_before, y_after) -> bool:
 
 
 def r13_score(
-    y_true, y_before, y_after, x_before=None, x_after=None, zero_division="warn"
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    zero_division="warn",
+    sample_weight=None,
 ) -> float:
     """The $R_{13}$ score.
 
@@ -200,6 +1059,9 @@ def r13_score(
         zero_division: str or float, optional, default='warn'.
             Sets the value to return when there is a zero division.
 
+        sample_weight: 1d array-like, optional.
+            Weights of the samples. Defaults to 1 for every sample.
+
     Returns:
         score: float
 
@@ -210,14 +1072,9 @@ def r13_score(
 
         irrelevant cases: constI, I->I
     """
-    return score_robustness(
-        r13_robust_case,
-        r13_non_robust_case,
-        y_true,
-        y_before,
-        y_after,
-        x_before,
-        x_after,
+    return score_transitions(
+        "r13",
+        transition_counts(y_true, y_before, y_after, x_before, x_after, sample_weight),
         zero_division=zero_division,
     )
 
@@ -239,7 +1096,13 @@ def r13p_irrelevant_case(y_true, y_before, y_after) -> bool:
 
 
 def r13p_score(
-    y_true, y_before, y_after, x_before=None, x_after=None, zero_division="warn"
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    zero_division="warn",
+    sample_weight=None,
 ) -> float:
     """The $R_{13+}$ score.
 
@@ -268,6 +1131,9 @@ def r13p_score(
         zero_division: str or float, optional, default='warn'.
             Sets the value to return when there is a zero division.
 
+        sample_weight: 1d array-like, optional.
+            Weights of the samples. Defaults to 1 for every sample.
+
     Returns:
         score: float
 
@@ -278,14 +1144,9 @@ def r13p_score(
 
         irrelevant cases: constI, I->I
     """
-    return score_robustness(
-        r13p_robust_case,
-        r13p_non_robust_case,
-        y_true,
-        y_before,
-        y_after,
-        x_before,
-        x_after,
+    return score_transitions(
+        "r13p",
+        transition_counts(y_true, y_before, y_after, x_before, x_after, sample_weight),
         zero_division=zero_division,
     )
 
@@ -307,7 +1168,13 @@ def r12_irrelevant_case(y_true, y_before, y_after) -> bool:
 
 
 def r12_score(
-    y_true, y_before, y_after, x_before=None, x_after=None, zero_division="warn"
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    zero_division="warn",
+    sample_weight=None,
 ) -> float:
     """The $R_{12}$ score.
 
@@ -334,6 +1201,9 @@ def r12_score(
         zero_division: str or float, optional, default='warn'.
             Sets the value to return when there is a zero division.
 
+        sample_weight: 1d array-like, optional.
+            Weights of the samples. Defaults to 1 for every sample.
+
     Returns:
         score: float
 
@@ -344,14 +1214,9 @@ def r12_score(
 
         irrelevant cases: I->C
     """
-    return score_robustness(
-        r12_robust_case,
-        r12_non_robust_case,
-        y_true,
-        y_before,
-        y_after,
-        x_before,
-        x_after,
+    return score_transitions(
+        "r12",
+        transition_counts(y_true, y_before, y_after, x_before, x_after, sample_weight),
         zero_division=zero_division,
     )
 
@@ -375,7 +1240,13 @@ def r123_irrelevant_case(y_true, y_before, y_after) -> bool:
 
 
 def r123_score(
-    y_true, y_before, y_after, x_before=None, x_after=None, zero_division="warn"
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    zero_division="warn",
+    sample_weight=None,
 ) -> float:
     """The $R_{123}$ score.
 
@@ -401,6 +1272,9 @@ def r123_score(
         zero_division: str or float, optional, default='warn'.
             Sets the value to return when there is a zero division.
 
+        sample_weight: 1d array-like, optional.
+            Weights of the samples. Defaults to 1 for every sample.
+
     Returns:
         score: float
 
@@ -411,14 +1285,9 @@ def r123_score(
 
         irrelevant cases: -
     """
-    return score_robustness(
-        r123_robust_case,
-        r123_non_robust_case,
-        y_true,
-        y_before,
-        y_after,
-        x_before,
-        x_after,
+    return score_transitions(
+        "r123",
+        transition_counts(y_true, y_before, y_after, x_before, x_after, sample_weight),
         zero_division=zero_division,
     )
 
@@ -442,7 +1311,13 @@ def r123p_irrelevant_case(y_true, y_before, y_after) -> bool:
 
 
 def r123p_score(
-    y_true, y_before, y_after, x_before=None, x_after=None, zero_division="warn"
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    zero_division="warn",
+    sample_weight=None,
 ) -> float:
     """The $R_{123+}$ score.
 
@@ -468,6 +1343,9 @@ def r123p_score(
         zero_division: str or float, optional, default='warn'.
             Sets the value to return when there is a zero division.
 
+        sample_weight: 1d array-like, optional.
+            Weights of the samples. Defaults to 1 for every sample.
+
     Returns:
         score: float
 
@@ -478,90 +1356,57 @@ def r123p_score(
 
         irrelevant cases: -
     """
-    return score_robustness(
-        r123p_robust_case,
-        r123p_non_robust_case,
-        y_true,
-        y_before,
-        y_after,
-        x_before,
-        x_after,
+    return score_transitions(
+        "r123p",
+        transition_counts(y_true, y_before, y_after, x_before, x_after, sample_weight),
         zero_division=zero_division,
     )
 
 
-def c_to_i_count(y_true, y_before, y_after) -> int:
+def c_to_i_count(y_true, y_before, y_after, sample_weight=None) -> int:
     """The number of model outputs that change from correct to incorrect after back transcription."""
-    c = 0
-
-    for t, b, a in zip(y_true, y_before, y_after):
-        if c_to_i_case(t, b, a):
-            c += 1
+    counts = transition_counts(y_true, y_before, y_after, sample_weight=sample_weight)
 
-    return c
+    return counts[C_TO_I]
 
 
-def i_to_i_count(y_true, y_before, y_after) -> int:
+def i_to_i_count(y_true, y_before, y_after, sample_weight=None) -> int:
     """The number of model outputs that change from incorrect to incorrect after back transcription."""
-    c = 0
+    counts = transition_counts(y_true, y_before, y_after, sample_weight=sample_weight)
 
-    for t, b, a in zip(y_true, y_before, y_after):
-        if i_to_i_case(t, b, a):
-            c += 1
+    return counts[I_TO_I]
 
-    return c
 
-
-def i_to_c_count(y_true, y_before, y_after) -> int:
+def i_to_c_count(y_true, y_before, y_after, sample_weight=None) -> int:
     """The number of model outputs that change from incorrect to correct after back transcription."""
-    c = 0
-
-    for t, b, a in zip(y_true, y_before, y_after):
-        if i_to_c_case(t, b, a):
-            c += 1
+    counts = transition_counts(y_true, y_before, y_after, sample_weight=sample_weight)
 
-    return c
+    return counts[I_TO_C]
 
 
-def changed_count(y_true, y_before, y_after) -> int:
+def changed_count(y_true, y_before, y_after, sample_weight=None) -> int:
     """The number of model outputs that change after back transcription."""
-    c = 0
+    counts = transition_counts(y_true, y_before, y_after, sample_weight=sample_weight)
 
-    for t, b, a in zip(y_true, y_before, y_after):
-        if changed_case(t, b, a):
-            c += 1
+    return counts[C_TO_I] + counts[I_TO_I] + counts[I_TO_C]
 
-    return c
 
-
-def i_const_count(y_true, y_before, y_after) -> int:
+def i_const_count(y_true, y_before, y_after, sample_weight=None) -> int:
     """The number of incorrect model outputs that remain unchanged after back transcription."""
-    c = 0
-
-    for t, b, a in zip(y_true, y_before, y_after):
-        if i_const_case(t, b, a):
-            c += 1
+    counts = transition_counts(y_true, y_before, y_after, sample_weight=sample_weight)
 
-    return c
+    return counts[I_CONST]
 
 
-def c_const_count(y_true, y_before, y_after) -> int:
+def c_const_count(y_true, y_before, y_after, sample_weight=None) -> int:
     """The number of correct model outputs that remain unchanged after back transcription."""
-    c = 0
+    counts = transition_counts(y_true, y_before, y_after, sample_weight=sample_weight)
 
-    for t, b, a in zip(y_true, y_before, y_after):
-        if c_const_case(t, b, a):
-            c += 1
+    return counts[C_CONST]
 
-    return c
 
-
-def const_count(y_true, y_before, y_after) -> int:
+def const_count(y_true, y_before, y_after, sample_weight=None) -> int:
     """The number of model outputs that remain unchanged after back transcription."""
-    c = 0
-
-    for t, b, a in zip(y_true, y_before, y_after):
-        if const_case(t, b, a):
-            c += 1
+    counts = transition_counts(y_true, y_before, y_after, sample_weight=sample_weight)
 
-    return c
+    return counts[C_CONST] + counts[I_CONST]
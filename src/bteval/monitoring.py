@@ -0,0 +1,229 @@
+import time
+from array import array
+
+from .metrics import score_transitions, transition_case, transition_report
+
+
+class RobustnessWindow:
+    """Tracks transition counts over a sliding window of the most recent samples.
+
+    The transition codes of the samples in the window are kept in a ring buffer, so adding a sample
+    and evicting the oldest one take constant time. The window is bounded by the number of samples,
+    by their age or by both.
+
+    Args:
+        size: int, optional.
+            The maximum number of samples in the window.
+
+        duration: float, optional.
+            The maximum age of the samples in the window, in the units of the timestamps.
+
+        clock: callable, optional, default=time.monotonic.
+            Provides timestamps for samples added without one and for queries without now.
+    """
+
+    def __init__(self, size=None, duration=None, clock=time.monotonic):
+        if size is None and duration is None:
+            raise ValueError("Either size or duration must be given")
+
+        if size is not None and size <= 0:
+            raise ValueError("size must be positive")
+
+        if duration is not None and duration <= 0:
+            raise ValueError("duration must be positive")
+
+        self.size = size
+        self.duration = duration
+        self.clock = clock
+        self.counts = [0, 0, 0, 0, 0]
+
+        capacity = 1024 if size is None else size
+        self._codes = bytearray(capacity)
+        self._timestamps = None if duration is None else array("d", bytes(8 * capacity))
+        self._head = 0
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def add(
+        self, y_true, y_before, y_after, x_before=None, x_after=None, timestamp=None
+    ):
+        """Adds a single sample to the window.
+
+        Samples whose reference and back transcribed texts are the same are ignored. Timestamps
+        must not decrease between consecutive samples.
+        """
+        if x_before is not None and x_after is not None and x_before == x_after:
+            return self
+
+        if self.duration is not None:
+            timestamp = self.clock() if timestamp is None else timestamp
+            self.expire(timestamp)
+
+        if self._length == len(self._codes):
+            if self.size is not None:
+                self._pop()
+            else:
+                self._grow()
+
+        code = transition_case(y_true, y_before, y_after)
+        tail = (self._head + self._length) % len(self._codes)
+        self._codes[tail] = code
+
+        if self._timestamps is not None:
+            self._timestamps[tail] = timestamp
+
+        self._length += 1
+        self.counts[code] += 1
+
+        return self
+
+    def update(
+        self, y_true, y_before, y_after, x_before=None, x_after=None, timestamps=None
+    ):
+        """Adds a batch of samples to the window."""
+
+        n_samples = len(y_true)
+
+        if x_before is None or x_after is None:
+            x_before = x_after = [None] * n_samples
+
+        if timestamps is None:
+            timestamps = [None] * n_samples
+
+        for t, b, a, xb, xa, ts in zip(
+            y_true, y_before, y_after, x_before, x_after, timestamps
+        ):
+            self.add(t, b, a, xb, xa, timestamp=ts)
+
+        return self
+
+    def expire(self, now=None):
+        """Evicts the samples that are older than duration."""
+
+        if self.duration is None:
+            return self
+
+        now = self.clock() if now is None else now
+
+        while self._length and self._timestamps[self._head] <= now - self.duration:
+            self._pop()
+
+        return self
+
+    def _pop(self):
+        self.counts[self._codes[self._head]] -= 1
+        self._head = (self._head + 1) % len(self._codes)
+        self._length -= 1
+
+    def _grow(self):
+        head = self._head
+        self._codes = (
+            self._codes[head:] + self._codes[:head] + bytearray(len(self._codes))
+        )
+
+        if self._timestamps is not None:
+            padding = array("d", bytes(8 * len(self._timestamps)))
+            self._timestamps = (
+                self._timestamps[head:] + self._timestamps[:head] + padding
+            )
+
+        self._head = 0
+
+    def score(self, measure, zero_division="warn", now=None) -> float:
+        """Scores robustness of the given measure (e.g. 'r1') on the samples in the window."""
+
+        self.expire(now)
+
+        return score_transitions(measure, self.counts, zero_division=zero_division)
+
+    def report(self, zero_division="warn", now=None) -> dict:
+        """All $R_*$ scores and *_count values on the samples in the window."""
+
+        self.expire(now)
+
+        return transition_report(self.counts, zero_division=zero_division)
+
+
+class DecayedRobustnessEstimator:
+    """Tracks exponentially decayed transition counts of a stream of samples.
+
+    Every sample adds 1 to the count of its transition class, after all counts are decayed. The
+    state consists of five floats, so the cost of a sample is constant and no history is kept.
+
+    Args:
+        half_life: float.
+            The number of samples (or, if samples are added with timestamps, the time) after which
+            the weight of a sample is halved.
+    """
+
+    def __init__(self, half_life):
+        if half_life <= 0:
+            raise ValueError("half_life must be positive")
+
+        self.half_life = half_life
+        self.counts = [0.0, 0.0, 0.0, 0.0, 0.0]
+        self._event_decay = 0.5 ** (1 / half_life)
+        self._last_timestamp = None
+
+    def add(
+        self, y_true, y_before, y_after, x_before=None, x_after=None, timestamp=None
+    ):
+        """Adds a single sample to the estimate.
+
+        Without a timestamp the counts are decayed by one sample. With a timestamp they are
+        decayed by the time elapsed since the previous timestamped sample. Samples whose reference
+        and back transcribed texts are the same are ignored.
+        """
+        if x_before is not None and x_after is not None and x_before == x_after:
+            return self
+
+        if timestamp is None:
+            decay = self._event_decay
+        elif self._last_timestamp is None:
+            decay = 1.0
+        else:
+            decay = 0.5 ** ((timestamp - self._last_timestamp) / self.half_life)
+
+        if timestamp is not None:
+            self._last_timestamp = timestamp
+
+        counts = self.counts
+
+        for i in range(5):
+            counts[i] *= decay
+
+        counts[transition_case(y_true, y_before, y_after)] += 1.0
+
+        return self
+
+    def update(
+        self, y_true, y_before, y_after, x_before=None, x_after=None, timestamps=None
+    ):
+        """Adds a batch of samples to the estimate."""
+
+        n_samples = len(y_true)
+
+        if x_before is None or x_after is None:
+            x_before = x_after = [None] * n_samples
+
+        if timestamps is None:
+            timestamps = [None] * n_samples
+
+        for t, b, a, xb, xa, ts in zip(
+            y_true, y_before, y_after, x_before, x_after, timestamps
+        ):
+            self.add(t, b, a, xb, xa, timestamp=ts)
+
+        return self
+
+    def score(self, measure, zero_division="warn") -> float:
+        """The decayed score of the given measure (e.g. 'r1')."""
+
+        return score_transitions(measure, self.counts, zero_division=zero_division)
+
+    def report(self, zero_division="warn") -> dict:
+        """All decayed $R_*$ scores and *_count values."""
+
+        return transition_report(self.counts, zero_division=zero_division)
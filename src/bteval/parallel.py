@@ -0,0 +1,121 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .metrics import transition_counts, transition_report
+
+
+def _sum_counts(counts_iter) -> tuple:
+    total = [0, 0, 0, 0, 0]
+
+    for counts in counts_iter:
+        for i, count in enumerate(counts):
+            total[i] += count
+
+    return tuple(total)
+
+
+def _shard_counts(shard) -> tuple:
+    return transition_counts(*shard)
+
+
+def _file_counts(loader, path) -> tuple:
+    return transition_counts(*loader(path))
+
+
+def _slice(column, start, stop):
+    if column is None:
+        return None
+
+    return column[start:stop]
+
+
+def parallel_transition_counts(
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    n_jobs=None,
+    shard_size=None,
+) -> tuple:
+    """Counts the samples of every transition class in a pool of worker processes.
+
+    The inputs are split into shards of shard_size samples (by default, one shard per worker).
+    Workers return only the transition counts of their shards.
+
+    Args:
+        n_jobs: int, optional.
+            The number of worker processes. Defaults to the number of CPUs.
+
+        shard_size: int, optional.
+            The number of samples sent to a worker at once.
+
+    Returns:
+        counts: tuple of ints indexed by C_CONST, I_CONST, C_TO_I, I_TO_I and I_TO_C.
+    """
+    n_jobs = n_jobs or os.cpu_count() or 1
+    n_samples = len(y_true)
+    shard_size = shard_size or max(1, math.ceil(n_samples / n_jobs))
+
+    shards = (
+        (
+            _slice(y_true, start, start + shard_size),
+            _slice(y_before, start, start + shard_size),
+            _slice(y_after, start, start + shard_size),
+            _slice(x_before, start, start + shard_size),
+            _slice(x_after, start, start + shard_size),
+        )
+        for start in range(0, n_samples, shard_size)
+    )
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return _sum_counts(executor.map(_shard_counts, shards))
+
+
+def parallel_file_transition_counts(paths, loader, n_jobs=None) -> tuple:
+    """Counts the samples of every transition class across files in a pool of worker processes.
+
+    Args:
+        paths: list of str.
+            The files to score, one file per task.
+
+        loader: callable.
+            A picklable function that takes a path and returns the tuple of columns
+            (y_true, y_before, y_after[, x_before, x_after]) stored in the file.
+
+        n_jobs: int, optional.
+            The number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        counts: tuple of ints indexed by C_CONST, I_CONST, C_TO_I, I_TO_I and I_TO_C.
+    """
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return _sum_counts(executor.map(_file_counts, [loader] * len(paths), paths))
+
+
+def parallel_robustness_report(
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    zero_division="warn",
+    n_jobs=None,
+    shard_size=None,
+) -> dict:
+    """All $R_*$ scores and *_count values computed in a pool of worker processes.
+
+    See robustness_report and parallel_transition_counts for the description of the arguments.
+    """
+    counts = parallel_transition_counts(
+        y_true,
+        y_before,
+        y_after,
+        x_before,
+        x_after,
+        n_jobs=n_jobs,
+        shard_size=shard_size,
+    )
+
+    return transition_report(counts, zero_division=zero_division)
@@ -0,0 +1,69 @@
+import contextlib
+import contextvars
+import time
+from collections import namedtuple
+
+StageEvent = namedtuple("StageEvent", ["stage", "seconds", "n_samples", "n_removed"])
+StageEvent.__doc__ = """Wall time and sample counts of a single stage of scoring.
+
+Stages are 'convert' (conversion of the inputs to arrays or tensors), 'filter' (removal of the
+samples with unchanged texts), 'tally' (classification of the samples) and 'aggregate'
+(computation of a score from the counts). n_samples is the number of samples that leave the stage
+and n_removed is the number of samples removed by it. Stages of chunked inputs are summed over the
+chunks. For lists, filtering is fused with the tally and its time is reported under 'tally'.
+"""
+
+_stage_callback = contextvars.ContextVar("bteval_stage_callback", default=None)
+
+
+@contextlib.contextmanager
+def profile_stages(callback=None):
+    """Reports the stages of scoring performed within the context.
+
+    Profiling is disabled outside of the context and costs a single context variable lookup per
+    scoring call.
+
+    Args:
+        callback: callable, optional.
+            Called with a StageEvent after every stage. Defaults to appending the events to the
+            list returned by the context manager.
+
+    Yields:
+        events: list of StageEvent, empty if callback is given.
+    """
+    events = []
+    token = _stage_callback.set(callback or events.append)
+
+    try:
+        yield events
+    finally:
+        _stage_callback.reset(token)
+
+
+def _emit(callback, stage, start, n_samples, n_removed) -> float:
+    end = time.perf_counter()
+    callback(StageEvent(stage, end - start, n_samples, n_removed))
+
+    return end
+
+
+class _StageTimer:
+    def __init__(self, callback):
+        self.callback = callback
+        self.stages = {}
+        self.start = time.perf_counter()
+
+    def lap(self, stage, n_samples, n_removed=0):
+        end = time.perf_counter()
+        seconds, total_samples, total_removed = self.stages.get(stage, (0.0, 0, 0))
+        self.stages[stage] = (
+            seconds + end - self.start,
+            total_samples + n_samples,
+            total_removed + n_removed,
+        )
+        self.start = end
+
+    def emit(self):
+        for stage in ("convert", "filter", "tally"):
+            if stage in self.stages:
+                self.callback(StageEvent(stage, *self.stages[stage]))
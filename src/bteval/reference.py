@@ -0,0 +1,86 @@
+from .metrics import _counts_from_masks, score_transitions, transition_report
+from .text import TextNormalizer
+
+
+class RobustnessReference:
+    """Precomputed reference side of a test set for scoring many hypotheses.
+
+    The ground truth, the outcome of the NLU model on the reference texts and the digests of the
+    reference texts do not depend on the ASR system. They are processed once, so that scoring a
+    hypothesis only involves the work that depends on y_after and x_after.
+
+    Args:
+        y_true: 1d array-like.
+            The expected outcome of the NLU model (ground truth).
+
+        y_before: 1d array-like.
+            The outcome of the NLU model for the text before back transcription.
+
+        x_before: 1d array-like, optional.
+            Reference, i.e. the text before back transcription.
+
+        normalizer: TextNormalizer, optional.
+            Texts are compared through the 64-bit digests of their normalized forms. Defaults to a
+            TextNormalizer that leaves the texts unchanged.
+    """
+
+    def __init__(self, y_true, y_before, x_before=None, normalizer=None):
+        import numpy as np
+
+        self.y_true = np.asarray(y_true)
+        self.y_before = np.asarray(y_before)
+
+        if self.y_true.shape != self.y_before.shape:
+            raise ValueError("y_true and y_before must have the same length")
+
+        self.normalizer = normalizer or TextNormalizer(
+            lowercase=False, strip_punctuation=False, collapse_whitespace=False
+        )
+        self.x_before = None if x_before is None else self._texts(x_before)
+        self.correct_before = self.y_before == self.y_true
+
+    def _texts(self, texts):
+        import numpy as np
+
+        return np.fromiter(map(self.normalizer.digest, texts), dtype=np.int64)
+
+    def transition_counts(self, y_after, x_after=None) -> tuple:
+        """Counts the samples of every transition class for the given hypothesis side.
+
+        Returns:
+            counts: tuple of ints indexed by C_CONST, I_CONST, C_TO_I, I_TO_I and I_TO_C.
+        """
+        import numpy as np
+
+        y_after = np.asarray(y_after)
+
+        if y_after.shape != self.y_true.shape:
+            raise ValueError("y_after must have the same length as y_true")
+
+        changed_text = None
+
+        if self.x_before is not None and x_after is not None:
+            changed_text = self.x_before != self._texts(x_after)
+
+        return _counts_from_masks(
+            self.correct_before,
+            y_after == self.y_true,
+            y_after == self.y_before,
+            changed_text,
+        )
+
+    def score(self, measure, y_after, x_after=None, zero_division="warn") -> float:
+        """Scores robustness of the given measure (e.g. 'r1') for the given hypothesis side."""
+
+        return score_transitions(
+            measure,
+            self.transition_counts(y_after, x_after),
+            zero_division=zero_division,
+        )
+
+    def report(self, y_after, x_after=None, zero_division="warn") -> dict:
+        """All $R_*$ scores and *_count values for the given hypothesis side."""
+
+        return transition_report(
+            self.transition_counts(y_after, x_after), zero_division=zero_division
+        )
@@ -0,0 +1,254 @@
+import warnings
+
+from .metrics import (
+    MEASURES,
+    Measure,
+    robustness_counts,
+    transition_codes,
+    transition_counts,
+)
+
+
+def _rng(random_state):
+    import numpy as np
+
+    return np.random.default_rng(random_state)
+
+
+def _ratio(robust, non_robust):
+    import numpy as np
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return robust / (robust + non_robust)
+
+
+def _fill_undefined(scores, zero_division):
+    import numpy as np
+
+    undefined = np.isnan(scores)
+
+    if not undefined.any():
+        return scores, False
+
+    fill = 0.0 if zero_division == "warn" else zero_division
+
+    return np.where(undefined, fill, scores), True
+
+
+def bootstrap_transition_counts(
+    counts, n_resamples=10000, confidence_level=0.95, random_state=None
+) -> dict:
+    """Bootstrap confidence intervals of all $R_*$ scores from transition counts.
+
+    Resampling samples with replacement is equivalent to drawing transition counts from the
+    multinomial distribution parametrized by the observed class frequencies, so all resamples are
+    drawn at once and their cost does not depend on the number of samples.
+
+    Args:
+        counts: tuple of ints.
+            Transition counts indexed by C_CONST, I_CONST, C_TO_I, I_TO_I and I_TO_C.
+
+        n_resamples: int, optional, default=10000.
+            The number of bootstrap resamples.
+
+        confidence_level: float, optional, default=0.95.
+            The confidence level of the intervals.
+
+        random_state: int or numpy.random.Generator, optional.
+            The seed or generator used to draw the resamples.
+
+    Returns:
+        intervals: dict
+            Maps the names of the score functions (e.g. 'r1_score') to (low, high) tuples.
+            Resamples without robust and non-robust cases are ignored. If all of them are
+            ignored the interval is (nan, nan).
+    """
+    import numpy as np
+
+    counts = np.asarray(counts, dtype=np.int64)
+    n_samples = int(counts.sum())
+    probabilities = counts / n_samples if n_samples else np.full(5, 0.2)
+    resamples = (
+        _rng(random_state).multinomial(n_samples, probabilities, size=n_resamples).T
+    )
+
+    alpha = (1 - confidence_level) / 2
+    intervals = {}
+
+    for measure in MEASURES:
+        scores = _ratio(*robustness_counts(measure, resamples))
+
+        if np.isnan(scores).all():
+            intervals[measure + "_score"] = (float("nan"), float("nan"))
+        else:
+            low, high = np.nanquantile(scores, [alpha, 1 - alpha])
+            intervals[measure + "_score"] = (float(low), float(high))
+
+    return intervals
+
+
+def bootstrap_robustness(
+    y_true,
+    y_before,
+    y_after,
+    x_before=None,
+    x_after=None,
+    n_resamples=10000,
+    confidence_level=0.95,
+    random_state=None,
+) -> dict:
+    """Bootstrap confidence intervals of all $R_*$ scores.
+
+    Args:
+        y_true: 1d array-like.
+            The expected outcome of the NLU model (ground truth).
+
+        y_before: 1d array-like.
+            The outcome of the NLU model for the text before back transcription.
+
+        y_after: 1d array-like.
+            The outcome of the NLU model for the text after back transcription.
+
+        x_before: 1d array-like, optional.
+            Reference, i.e. the text before back transcription.
+
+        x_after: 1d array-like, optional.
+            Hypothesis, i.e. the text after back transcription.
+
+        n_resamples: int, optional, default=10000.
+            The number of bootstrap resamples.
+
+        confidence_level: float, optional, default=0.95.
+            The confidence level of the intervals.
+
+        random_state: int or numpy.random.Generator, optional.
+            The seed or generator used to draw the resamples.
+
+    Returns:
+        intervals: dict
+            Maps the names of the score functions (e.g. 'r1_score') to (low, high) tuples.
+    """
+    counts = transition_counts(y_true, y_before, y_after, x_before, x_after)
+
+    return bootstrap_transition_counts(
+        counts,
+        n_resamples=n_resamples,
+        confidence_level=confidence_level,
+        random_state=random_state,
+    )
+
+
+def paired_permutation_test(
+    measure,
+    y_true,
+    y_before,
+    y_after_a,
+    y_after_b,
+    x_before=None,
+    x_after_a=None,
+    x_after_b=None,
+    n_resamples=10000,
+    random_state=None,
+    zero_division="warn",
+) -> dict:
+    """Paired permutation test of the difference in robustness between two systems.
+
+    Under the null hypothesis the outcomes of both systems are exchangeable for every sample. A
+    resample swaps the outcomes of a random subset of samples. Since the score depends only on the
+    joint transition classes of the two systems, the samples are summarized in a 6x6 table of
+    (class under A, class under B) pairs (the sixth class marks samples with unchanged texts) and
+    the number of swapped samples in every cell is drawn from a binomial distribution, which makes
+    the cost of the test independent of the number of samples.
+
+    Args:
+        measure: Measure or str.
+            The measure or the name of a built-in measure (e.g. 'r1').
+
+        y_true: 1d array-like.
+            The expected outcome of the NLU model (ground truth).
+
+        y_before: 1d array-like.
+            The outcome of the NLU model for the text before back transcription.
+
+        y_after_a: 1d array-like.
+            The outcome of the NLU model for the text back transcribed by system A.
+
+        y_after_b: 1d array-like.
+            The outcome of the NLU model for the text back transcribed by system B.
+
+        x_before: 1d array-like, optional.
+            Reference, i.e. the text before back transcription.
+
+        x_after_a: 1d array-like, optional.
+            Hypothesis of system A.
+
+        x_after_b: 1d array-like, optional.
+            Hypothesis of system B.
+
+        n_resamples: int, optional, default=10000.
+            The number of permutation resamples.
+
+        random_state: int or numpy.random.Generator, optional.
+            The seed or generator used to draw the resamples.
+
+        zero_division: str or float, optional, default='warn'.
+            Sets the value of the scores that are ill-defined, both observed and resampled.
+
+    Returns:
+        result: dict
+            score_a, score_b, difference (score_b - score_a) and the two-sided p_value.
+    """
+    import numpy as np
+
+    if not isinstance(measure, Measure):
+        measure = MEASURES[measure]
+
+    codes_a = transition_codes(y_true, y_before, y_after_a, x_before, x_after_a)
+    codes_b = transition_codes(y_true, y_before, y_after_b, x_before, x_after_b)
+    table = np.bincount(codes_a.astype(np.intp) * 6 + codes_b, minlength=36)
+
+    outcomes = np.asarray(measure.table + (0,))
+    robust = (outcomes == 1).astype(np.int64)
+    non_robust = (outcomes == -1).astype(np.int64)
+
+    # Swapping the samples of cell (i, j) moves them from class i to class j under A.
+    robust_shift = (robust[None, :] - robust[:, None]).ravel()
+    non_robust_shift = (non_robust[None, :] - non_robust[:, None]).ravel()
+
+    classes_a = table.reshape(6, 6).sum(axis=1)
+    classes_b = table.reshape(6, 6).sum(axis=0)
+    robust_a, non_robust_a = classes_a @ robust, classes_a @ non_robust
+    robust_b, non_robust_b = classes_b @ robust, classes_b @ non_robust
+
+    scores, undefined = _fill_undefined(
+        _ratio(
+            np.asarray([robust_a, robust_b]), np.asarray([non_robust_a, non_robust_b])
+        ),
+        zero_division,
+    )
+    score_a, score_b = scores.tolist()
+    difference = score_b - score_a
+
+    swapped = _rng(random_state).binomial(table, 0.5, size=(n_resamples, 36))
+    robust_delta = swapped @ robust_shift
+    non_robust_delta = swapped @ non_robust_shift
+
+    scores_a, undefined_a = _fill_undefined(
+        _ratio(robust_a + robust_delta, non_robust_a + non_robust_delta), zero_division
+    )
+    scores_b, undefined_b = _fill_undefined(
+        _ratio(robust_b - robust_delta, non_robust_b - non_robust_delta), zero_division
+    )
+
+    if zero_division == "warn" and (undefined or undefined_a or undefined_b):
+        warnings.warn("Robustness score ill-defined and being set to 0.0")
+
+    extreme = np.count_nonzero(np.abs(scores_b - scores_a) >= abs(difference) - 1e-12)
+    p_value = float((extreme + 1) / (n_resamples + 1))
+
+    return {
+        "score_a": score_a,
+        "score_b": score_b,
+        "difference": difference,
+        "p_value": p_value,
+    }
@@ -0,0 +1,52 @@
+from .metrics import score_transitions, transition_counts, transition_report
+
+
+class RobustnessAccumulator:
+    """Accumulates transition counts over batches of samples.
+
+    The accumulator keeps only the five transition counts, so its memory footprint does not depend
+    on the number of samples seen. Accumulators updated on separate shards can be merged in any
+    order.
+    """
+
+    def __init__(self, counts=(0, 0, 0, 0, 0)):
+        self.counts = list(counts)
+
+    def update(
+        self,
+        y_true,
+        y_before,
+        y_after,
+        x_before=None,
+        x_after=None,
+        sample_weight=None,
+        normalizer=None,
+    ):
+        """Adds a batch of samples to the accumulated counts, see transition_counts."""
+
+        batch_counts = transition_counts(
+            y_true, y_before, y_after, x_before, x_after, sample_weight, normalizer
+        )
+
+        for i, count in enumerate(batch_counts):
+            self.counts[i] += count
+
+        return self
+
+    def merge(self, other):
+        """Adds the counts accumulated by other."""
+
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+
+        return self
+
+    def score(self, measure, zero_division="warn") -> float:
+        """Scores robustness of the given measure (e.g. 'r13') on the samples seen so far."""
+
+        return score_transitions(measure, self.counts, zero_division=zero_division)
+
+    def report(self, zero_division="warn") -> dict:
+        """All $R_*$ scores and *_count values on the samples seen so far."""
+
+        return transition_report(self.counts, zero_division=zero_division)
@@ -0,0 +1,75 @@
+import hashlib
+import re
+from functools import lru_cache
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+class TextNormalizer:
+    """Normalizes texts and maps them to fixed-size digests.
+
+    Normalized digests can be passed as x_before and x_after to any scoring function in place of
+    the texts, so that differences in casing, punctuation or whitespace introduced by an ASR
+    system are not treated as changes and the texts do not have to be kept in memory.
+
+    Args:
+        lowercase: bool, optional, default=True.
+            Converts texts to lowercase.
+
+        strip_punctuation: bool, optional, default=True.
+            Removes punctuation characters.
+
+        collapse_whitespace: bool, optional, default=True.
+            Replaces runs of whitespace with single spaces and strips leading and trailing
+            whitespace.
+
+        cache_size: int, optional, default=65536.
+            The number of distinct texts whose digests are cached.
+    """
+
+    def __init__(
+        self,
+        lowercase=True,
+        strip_punctuation=True,
+        collapse_whitespace=True,
+        cache_size=65536,
+    ):
+        self.lowercase = lowercase
+        self.strip_punctuation = strip_punctuation
+        self.collapse_whitespace = collapse_whitespace
+        self.cache_size = cache_size
+        self.digest = lru_cache(maxsize=cache_size)(self._digest)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["digest"]
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.digest = lru_cache(maxsize=self.cache_size)(self._digest)
+
+    def normalize(self, text) -> str:
+        """Normalizes a single text."""
+
+        if self.lowercase:
+            text = text.lower()
+
+        if self.strip_punctuation:
+            text = _PUNCTUATION.sub("", text)
+
+        if self.collapse_whitespace:
+            text = " ".join(text.split())
+
+        return text
+
+    def _digest(self, text) -> int:
+        digest = hashlib.blake2b(self.normalize(text).encode(), digest_size=8).digest()
+
+        return int.from_bytes(digest, "little", signed=True)
+
+    def digests(self, texts) -> list:
+        """Maps an iterable of texts to a list of 64-bit digests of their normalized forms."""
+
+        return [self.digest(text) for text in texts]
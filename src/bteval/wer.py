@@ -0,0 +1,244 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .metrics import robustness_breakdown
+
+WER_BINS = (0.0, 0.1, 0.2, 0.3, 0.5, 1.0)
+
+
+def _edit_distance(ref, hyp, row) -> int:
+    start = 0
+    end_ref = len(ref)
+    end_hyp = len(hyp)
+
+    while start < end_ref and start < end_hyp and ref[start] == hyp[start]:
+        start += 1
+
+    while end_ref > start and end_hyp > start and ref[end_ref - 1] == hyp[end_hyp - 1]:
+        end_ref -= 1
+        end_hyp -= 1
+
+    if start == end_ref:
+        return end_hyp - start
+
+    if start == end_hyp:
+        return end_ref - start
+
+    m = end_hyp - start
+    row[: m + 1] = range(m + 1)
+
+    for i in range(start, end_ref):
+        word = ref[i]
+        diag = row[0]
+        row[0] = i - start + 1
+
+        for j in range(1, m + 1):
+            up = row[j]
+
+            if word == hyp[start + j - 1]:
+                row[j] = diag
+            else:
+                row[j] = min(diag, up, row[j - 1]) + 1
+
+            diag = up
+
+    return row[m]
+
+
+def _tokenize(text, normalizer) -> list:
+    if normalizer is not None:
+        text = normalizer.normalize(text)
+
+    return text.split()
+
+
+def _shard_errors(shard) -> tuple:
+    x_before, x_after, normalizer = shard
+    row = []
+    errors = []
+    lengths = []
+
+    for xb, xa in zip(x_before, x_after):
+        ref = _tokenize(xb, normalizer)
+        lengths.append(len(ref))
+
+        if xb == xa:
+            errors.append(0)
+        else:
+            errors.append(_edit_distance(ref, _tokenize(xa, normalizer), row))
+
+    return errors, lengths
+
+
+def word_errors(x_before, x_after, normalizer=None, n_jobs=1, shard_size=None) -> tuple:
+    """Word-level edit distances between the references and the hypotheses.
+
+    Every pair is aligned with a single-row dynamic program whose buffer is reused across the pairs
+    of a shard, after the common prefix and suffix of the pair are skipped. Identical texts are not
+    aligned at all.
+
+    Args:
+        x_before: 1d array-like.
+            Reference, i.e. the text before back transcription.
+
+        x_after: 1d array-like.
+            Hypothesis, i.e. the text after back transcription.
+
+        normalizer: TextNormalizer, optional.
+            If given, texts are normalized before they are split into words.
+
+        n_jobs: int, optional, default=1.
+            The number of worker processes. If greater than 1, the pairs are split into shards of
+            shard_size pairs (by default, one shard per worker) that are aligned in a pool.
+
+        shard_size: int, optional.
+            The number of pairs sent to a worker at once.
+
+    Returns:
+        errors: int64 ndarray
+            The number of substitutions, deletions and insertions of every pair.
+
+        lengths: int64 ndarray
+            The number of words of every reference.
+    """
+    import numpy as np
+
+    if len(x_before) != len(x_after):
+        raise ValueError("x_before and x_after must have the same length")
+
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    if n_jobs == 1:
+        errors, lengths = _shard_errors((x_before, x_after, normalizer))
+    else:
+        n_samples = len(x_before)
+        shard_size = shard_size or max(1, math.ceil(n_samples / n_jobs))
+        shards = (
+            (
+                x_before[start : start + shard_size],
+                x_after[start : start + shard_size],
+                normalizer,
+            )
+            for start in range(0, n_samples, shard_size)
+        )
+        errors = []
+        lengths = []
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            for shard_errors, shard_lengths in executor.map(_shard_errors, shards):
+                errors += shard_errors
+                lengths += shard_lengths
+
+    return np.asarray(errors, dtype=np.int64), np.asarray(lengths, dtype=np.int64)
+
+
+def word_error_rates(x_before, x_after, normalizer=None, n_jobs=1, shard_size=None):
+    """Per-sample word error rates, see word_errors for the description of the arguments.
+
+    The rate of a pair with an empty reference is its number of inserted words.
+
+    Returns:
+        rates: float64 ndarray
+    """
+    import numpy as np
+
+    errors, lengths = word_errors(x_before, x_after, normalizer, n_jobs, shard_size)
+
+    return errors / np.maximum(lengths, 1)
+
+
+def robustness_by_wer(
+    y_true,
+    y_before,
+    y_after,
+    x_before,
+    x_after,
+    bins=WER_BINS,
+    normalizer=None,
+    zero_division="warn",
+    sample_weight=None,
+    n_jobs=1,
+) -> dict:
+    """All $R_*$ scores and *_count values for every word error rate bucket.
+
+    The word error rates are computed with word_error_rates and the samples of all buckets are
+    tallied in a single pass by robustness_breakdown. Samples whose reference and back transcribed
+    texts are the same (after normalization, if normalizer is given) are skipped.
+
+    Args:
+        y_true: 1d array-like.
+            The expected outcome of the NLU model (ground truth).
+
+        y_before: 1d array-like.
+            The outcome of the NLU model for the text before back transcription.
+
+        y_after: 1d array-like.
+            The outcome of the NLU model for the text after back transcription.
+
+        x_before: 1d array-like.
+            Reference, i.e. the text before back transcription.
+
+        x_after: 1d array-like.
+            Hypothesis, i.e. the text after back transcription.
+
+        bins: sequence of floats, optional, default=WER_BINS.
+            Increasing upper edges of the buckets. A sample falls into the first bucket whose edge
+            is greater than or equal to its word error rate. Rates above the last edge fall into
+            a bucket with the edge math.inf.
+
+        normalizer: TextNormalizer, optional.
+            If given, texts are normalized before they are compared and split into words.
+
+        zero_division: str or float, optional, default='warn'.
+            Sets the value to return when there is a zero division.
+
+        sample_weight: 1d array-like, optional.
+            Weights of the samples. Defaults to 1 for every sample.
+
+        n_jobs: int, optional, default=1.
+            The number of worker processes used to compute the word error rates.
+
+    Returns:
+        breakdown: dict
+            Maps the upper edges of the non-empty buckets to the reports returned by
+            robustness_report for their samples.
+    """
+    import numpy as np
+
+    if len(x_before) != len(x_after):
+        raise ValueError("x_before and x_after must have the same length")
+
+    if normalizer is None:
+        changed_text = np.fromiter(
+            (xb != xa for xb, xa in zip(x_before, x_after)), dtype=bool
+        )
+    else:
+        changed_text = np.fromiter(
+            map(normalizer.digest, x_before), dtype=np.int64
+        ) != np.fromiter(map(normalizer.digest, x_after), dtype=np.int64)
+
+    index = np.flatnonzero(changed_text)
+
+    if sample_weight is not None:
+        sample_weight = np.asarray(sample_weight)[index]
+
+    rates = word_error_rates(
+        [x_before[i] for i in index],
+        [x_after[i] for i in index],
+        normalizer,
+        n_jobs=n_jobs,
+    )
+    edges = list(bins) + [math.inf]
+    buckets = np.searchsorted(np.asarray(bins, dtype=np.float64), rates, side="left")
+
+    breakdown = robustness_breakdown(
+        np.asarray(y_true)[index],
+        np.asarray(y_before)[index],
+        np.asarray(y_after)[index],
+        buckets,
+        zero_division=zero_division,
+        sample_weight=sample_weight,
+    )
+
+    return {edges[bucket]: report for bucket, report in sorted(breakdown.items())}
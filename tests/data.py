@@ -0,0 +1,5 @@
+Y_TRUE = ["Inform", "Request", "Inform", "Inform", "Deny", "Inform"]
+Y_BEFORE = ["Inform", "Request", "Request", "Request", "Inform", "Inform"]
+Y_AFTER = ["Inform", "Confirm", "Request", "Confirm", "Deny", "Inform"]
+X_BEFORE = ["a", "b", "c", "d", "e", "f"]
+X_AFTER = ["a", "x", "c", "y", "z", "w"]
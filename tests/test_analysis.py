@@ -0,0 +1,106 @@
+import numpy as np
+import torch
+from bteval import (
+    C_CONST,
+    C_TO_I,
+    CONST_TEXT,
+    I_CONST,
+    I_TO_C,
+    I_TO_I,
+    TransitionIndex,
+    flip_index,
+    transition_case,
+    transition_codes,
+    transition_counts,
+)
+
+from .data import X_BEFORE, Y_BEFORE, Y_TRUE
+
+Y_AFTER_OLD = ["Inform", "Confirm", "Request", "Confirm", "Deny", "Inform"]
+Y_AFTER_NEW = ["Deny", "Request", "Request", "Inform", "Deny", "Inform"]
+X_AFTER_OLD = ["a", "x", "c", "y", "z", "w"]
+X_AFTER_NEW = ["x", "x", "c", "y", "z", "f"]
+
+
+def test_flip_index():
+    index = flip_index(Y_TRUE, Y_BEFORE, Y_AFTER_OLD, Y_AFTER_NEW)
+
+    assert {cell: indices.tolist() for cell, indices in index.items()} == {
+        (C_CONST, C_TO_I): [0],
+        (C_TO_I, C_CONST): [1],
+        (I_CONST, I_CONST): [2],
+        (I_TO_I, I_TO_C): [3],
+        (I_TO_C, I_TO_C): [4],
+        (C_CONST, C_CONST): [5],
+    }
+
+    for (old, new), indices in index.items():
+        for i in indices:
+            assert transition_case(Y_TRUE[i], Y_BEFORE[i], Y_AFTER_OLD[i]) == old
+            assert transition_case(Y_TRUE[i], Y_BEFORE[i], Y_AFTER_NEW[i]) == new
+
+
+def test_flip_index_texts():
+    index = flip_index(
+        np.asarray(Y_TRUE),
+        np.asarray(Y_BEFORE),
+        np.asarray(Y_AFTER_OLD),
+        np.asarray(Y_AFTER_NEW),
+        X_BEFORE,
+        X_AFTER_OLD,
+        X_AFTER_NEW,
+    )
+
+    assert {cell: indices.tolist() for cell, indices in index.items()} == {
+        (CONST_TEXT, C_TO_I): [0],
+        (C_TO_I, C_CONST): [1],
+        (CONST_TEXT, CONST_TEXT): [2],
+        (I_TO_I, I_TO_C): [3],
+        (I_TO_C, I_TO_C): [4],
+        (C_CONST, CONST_TEXT): [5],
+    }
+    assert index[(CONST_TEXT, CONST_TEXT)].dtype == np.int32
+
+
+def test_transition_codes():
+    expected = [C_CONST, C_TO_I, I_CONST, I_TO_I, I_TO_C, C_CONST]
+    expected_texts = [CONST_TEXT, C_TO_I, CONST_TEXT, I_TO_I, I_TO_C, C_CONST]
+
+    for array in [list, np.asarray]:
+        codes = transition_codes(array(Y_TRUE), array(Y_BEFORE), array(Y_AFTER_OLD))
+
+        assert codes.dtype == np.uint8
+        assert codes.tolist() == expected
+        assert (
+            transition_codes(
+                array(Y_TRUE),
+                array(Y_BEFORE),
+                array(Y_AFTER_OLD),
+                array(X_BEFORE),
+                array(X_AFTER_OLD),
+            ).tolist()
+            == expected_texts
+        )
+
+    assert (
+        transition_codes(
+            torch.tensor([1, 2, 1, 1, 3, 1]),
+            torch.tensor([1, 2, 2, 2, 1, 1]),
+            torch.tensor([1, 4, 2, 4, 3, 1]),
+        ).tolist()
+        == expected
+    )
+
+
+def test_transition_index():
+    index = TransitionIndex.from_labels(
+        Y_TRUE, Y_BEFORE, Y_AFTER_OLD, X_BEFORE, X_AFTER_OLD
+    )
+
+    assert len(index) == 6
+    assert index.counts() == transition_counts(
+        Y_TRUE, Y_BEFORE, Y_AFTER_OLD, X_BEFORE, X_AFTER_OLD
+    )
+    assert index.indices(CONST_TEXT).tolist() == [0, 2]
+    assert index.indices(I_CONST).tolist() == []
+    assert index.indices(C_TO_I) is index.indices(C_TO_I)
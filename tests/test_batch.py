@@ -0,0 +1,49 @@
+import numpy as np
+from bteval import (
+    batch_robustness_report,
+    batch_transition_counts,
+    robustness_report,
+    transition_counts,
+)
+from pytest import approx
+
+from .data import X_BEFORE, Y_BEFORE, Y_TRUE
+
+Y_AFTER = [
+    ["Inform", "Confirm", "Request", "Confirm", "Deny", "Inform"],
+    ["Inform", "Request", "Inform", "Confirm", "Deny", "Request"],
+    ["Deny", "Confirm", "Request", "Inform", "Inform", "Inform"],
+]
+X_AFTER = [
+    ["a", "x", "c", "y", "z", "w"],
+    ["x", "b", "y", "d", "z", "f"],
+    ["a", "b", "c", "d", "e", "f"],
+]
+
+
+def test_batch_transition_counts():
+    counts = batch_transition_counts(Y_TRUE, Y_BEFORE, Y_AFTER)
+
+    for system_counts, y_after in zip(counts, Y_AFTER):
+        assert tuple(system_counts) == transition_counts(Y_TRUE, Y_BEFORE, y_after)
+
+    counts = batch_transition_counts(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+
+    for system_counts, y_after, x_after in zip(counts, Y_AFTER, X_AFTER):
+        assert tuple(system_counts) == transition_counts(
+            Y_TRUE, Y_BEFORE, y_after, X_BEFORE, x_after
+        )
+
+
+def test_batch_robustness_report():
+    report = batch_robustness_report(
+        Y_TRUE, Y_BEFORE, np.asarray(Y_AFTER), X_BEFORE, X_AFTER, zero_division=0.0
+    )
+
+    for i, (y_after, x_after) in enumerate(zip(Y_AFTER, X_AFTER)):
+        system_report = robustness_report(
+            Y_TRUE, Y_BEFORE, y_after, X_BEFORE, x_after, zero_division=0.0
+        )
+
+        for name, value in system_report.items():
+            assert report[name][i] == approx(value)
@@ -0,0 +1,110 @@
+import os
+
+import numpy as np
+import torch
+from bteval import (
+    TransitionCache,
+    c_to_i_count,
+    load_columns,
+    r1_score,
+    robustness_report,
+    save_columns,
+    transition_counts,
+    use_cache,
+)
+from pytest import approx, raises
+
+from .data import X_AFTER, X_BEFORE, Y_AFTER, Y_BEFORE, Y_TRUE
+
+
+def test_use_cache(tmp_path):
+    expected = robustness_report(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+
+    with use_cache(str(tmp_path)) as cache:
+        assert robustness_report(
+            Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER
+        ) == approx(expected)
+
+    assert len(os.listdir(tmp_path)) == 1
+
+    key = cache.key(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+    cache.put(key, (3, 0, 1, 0, 0))
+
+    with use_cache(str(tmp_path)):
+        assert r1_score(
+            Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER, zero_division=1.0
+        ) == approx(0.75)
+
+
+def test_use_cache_arrays(tmp_path):
+    y_true = np.asarray([1, 2, 1])
+    y_before = np.asarray([1, 2, 2])
+    y_after = np.asarray([1, 3, 3])
+    cache_dir = str(tmp_path / "cache")
+
+    for _ in range(2):
+        with use_cache(cache_dir):
+            assert r1_score(y_true, y_before, y_after) == approx(0.5)
+            assert type(c_to_i_count(y_true, y_before, y_after)) is int
+
+    assert os.listdir(cache_dir) == [
+        TransitionCache(cache_dir).key(y_true, y_before, y_after) + ".json"
+    ]
+
+    save_columns(
+        str(tmp_path / "columns"), Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER
+    )
+    columns = load_columns(str(tmp_path / "columns"))
+    expected = robustness_report(**columns)
+
+    for _ in range(2):
+        with use_cache(cache_dir):
+            assert robustness_report(**columns) == approx(expected)
+
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_put_failure(tmp_path):
+    cache = TransitionCache(str(tmp_path))
+
+    with raises(TypeError):
+        cache.put("key", [object()])
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_key(tmp_path):
+    cache_key = TransitionCache(str(tmp_path)).key
+
+    assert cache_key(Y_TRUE, Y_BEFORE, Y_AFTER) == cache_key(
+        list(Y_TRUE), Y_BEFORE, Y_AFTER
+    )
+    assert cache_key(Y_TRUE, Y_BEFORE, Y_AFTER) != cache_key(
+        Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER
+    )
+    assert cache_key(Y_TRUE, Y_BEFORE, Y_AFTER) != cache_key(Y_TRUE, Y_AFTER, Y_BEFORE)
+
+    a = np.arange(6)
+    b = np.arange(6)
+    b[0] = 1
+
+    assert cache_key(a, a, a) == cache_key(np.arange(6), a, a)
+    assert cache_key(a, a, a) != cache_key(b, a, a)
+    assert cache_key(a, a, a) == cache_key(torch.arange(6), a, a)
+    assert cache_key(a, a, a) != cache_key(a.astype(np.int32), a, a)
+
+
+def test_eviction(tmp_path):
+    cache = TransitionCache(str(tmp_path), max_entries=2)
+
+    with use_cache(cache):
+        for i in range(1, 4):
+            assert c_to_i_count(Y_TRUE[:i], Y_BEFORE[:i], Y_AFTER[:i]) == (
+                transition_counts(Y_TRUE[:i], Y_BEFORE[:i], Y_AFTER[:i])[2]
+            )
+
+    assert len(os.listdir(tmp_path)) == 2
+    assert cache.get(cache.key(Y_TRUE[:1], Y_BEFORE[:1], Y_AFTER[:1])) is None
+    assert cache.get(cache.key(Y_TRUE[:3], Y_BEFORE[:3], Y_AFTER[:3])) == (
+        transition_counts(Y_TRUE[:3], Y_BEFORE[:3], Y_AFTER[:3])
+    )
@@ -0,0 +1,83 @@
+import json
+
+from bteval import robustness_report
+from bteval.cli import main
+from pytest import approx, raises
+
+from .data import X_AFTER, X_BEFORE, Y_AFTER, Y_BEFORE, Y_TRUE
+
+
+def write_jsonl(path, start, stop):
+    with open(path, "w") as f:
+        for i in range(start, stop):
+            record = {
+                "gold": Y_TRUE[i],
+                "y_before": Y_BEFORE[i],
+                "y_after": Y_AFTER[i],
+                "ref": X_BEFORE[i],
+                "hyp": X_AFTER[i],
+            }
+            f.write(json.dumps(record) + "\n")
+
+
+def write_tsv(path, start, stop):
+    with open(path, "w") as f:
+        f.write("gold\ty_before\ty_after\tref\thyp\n")
+
+        for i in range(start, stop):
+            f.write(
+                f"{Y_TRUE[i]}\t{Y_BEFORE[i]}\t{Y_AFTER[i]}\t{X_BEFORE[i]}\t{X_AFTER[i]}\n"
+            )
+
+
+def test_main(tmp_path, capsys):
+    write_jsonl(tmp_path / "a.jsonl", 0, 4)
+    write_tsv(tmp_path / "b.tsv", 4, 6)
+
+    for jobs in ["1", "2"]:
+        main(
+            [
+                str(tmp_path / "a.jsonl"),
+                str(tmp_path / "b.tsv"),
+                "--y-true",
+                "gold",
+                "--x-before",
+                "ref",
+                "--x-after",
+                "hyp",
+                "--batch-size",
+                "3",
+                "--jobs",
+                jobs,
+            ]
+        )
+
+        assert json.loads(capsys.readouterr().out) == approx(
+            robustness_report(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+        )
+
+
+def test_zero_division(tmp_path, capsys):
+    write_jsonl(tmp_path / "a.jsonl", 2, 3)
+
+    main([str(tmp_path / "a.jsonl"), "--y-true", "gold", "--zero-division", "1"])
+
+    assert json.loads(capsys.readouterr().out)["r1_score"] == 1.0
+
+
+def test_text_columns_together(tmp_path):
+    write_jsonl(tmp_path / "a.jsonl", 0, 4)
+
+    with raises(SystemExit):
+        main([str(tmp_path / "a.jsonl"), "--y-true", "gold", "--x-before", "ref"])
+
+
+def test_missing_column(tmp_path, capsys):
+    write_jsonl(tmp_path / "a.jsonl", 0, 4)
+    write_tsv(tmp_path / "b.tsv", 4, 6)
+
+    for path in [tmp_path / "a.jsonl", tmp_path / "b.tsv"]:
+        with raises(SystemExit):
+            main([str(path)])
+
+        assert f"{path}: missing column 'y_true'" in capsys.readouterr().err
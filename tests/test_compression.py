@@ -0,0 +1,58 @@
+import numpy as np
+import torch
+from bteval import collapse_samples, robustness_report, transition_counts
+from pytest import approx
+
+Y_TRUE = ["Inform", "Inform", "Request", "Inform", "Deny", "Inform", "Request"]
+Y_BEFORE = ["Inform", "Inform", "Inform", "Inform", "Deny", "Request", "Inform"]
+Y_AFTER = ["Inform", "Inform", "Request", "Inform", "Inform", "Inform", "Request"]
+X_BEFORE = ["yes", "yes", "stop", "yes", "no", "cancel", "stop"]
+X_AFTER = ["yes", "yes", "top", "yes", "now", "cancel", "top"]
+
+
+def test_collapse_samples():
+    columns = collapse_samples(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+
+    assert columns["y_true"] == ["Inform", "Request", "Deny", "Inform"]
+    assert columns["x_after"] == ["yes", "top", "now", "cancel"]
+    assert columns["sample_weight"] == [3, 2, 1, 1]
+    assert robustness_report(**columns) == approx(
+        robustness_report(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+    )
+
+    columns = collapse_samples(Y_TRUE, Y_BEFORE, Y_AFTER)
+
+    assert columns["x_before"] is None
+    assert columns["sample_weight"] == [3, 2, 1, 1]
+
+
+def test_collapse_samples_weighted():
+    columns = collapse_samples(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+    merged = collapse_samples(
+        columns["y_true"] * 2,
+        columns["y_before"] * 2,
+        columns["y_after"] * 2,
+        columns["x_before"] * 2,
+        columns["x_after"] * 2,
+        columns["sample_weight"] * 2,
+    )
+
+    assert merged["sample_weight"] == [6, 4, 2, 2]
+
+
+def test_collapse_samples_arrays():
+    y_true = np.asarray([0, 0, 1, 0, 2, 0, 1])
+    y_before = np.asarray([0, 0, 0, 0, 2, 1, 0])
+    y_after = np.asarray([0, 0, 1, 0, 0, 0, 1])
+    columns = collapse_samples(y_true, y_before, y_after)
+
+    assert columns["y_true"].dtype == y_true.dtype
+    assert columns["sample_weight"].tolist() == [3, 2, 1, 1]
+    assert transition_counts(**columns) == transition_counts(y_true, y_before, y_after)
+
+    columns = collapse_samples(
+        torch.as_tensor(y_true), torch.as_tensor(y_before), torch.as_tensor(y_after)
+    )
+
+    assert isinstance(columns["y_true"], torch.Tensor)
+    assert transition_counts(**columns) == transition_counts(y_true, y_before, y_after)
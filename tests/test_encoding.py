@@ -0,0 +1,64 @@
+import numpy as np
+import torch
+from bteval import LabelEncoder, batch_transition_counts, robustness_report
+from pytest import approx
+
+from .data import Y_AFTER, Y_BEFORE, Y_TRUE
+
+
+def test_encode():
+    encoder = LabelEncoder()
+    y_true, y_before, y_after = encoder.encode(Y_TRUE, Y_BEFORE, Y_AFTER)
+
+    assert y_true.dtype == np.int32
+    assert encoder.inverse_transform(y_after) == Y_AFTER
+    assert robustness_report(y_true, y_before, y_after) == approx(
+        robustness_report(Y_TRUE, Y_BEFORE, Y_AFTER)
+    )
+
+
+def test_encode_arrays():
+    encoder = LabelEncoder()
+    y_true = encoder.transform(np.asarray(Y_TRUE))
+    y_before = encoder.transform(Y_BEFORE)
+    y_after = encoder.transform(np.asarray(Y_AFTER, dtype=object))
+
+    assert encoder.inverse_transform(y_true) == Y_TRUE
+    assert encoder.inverse_transform(y_after) == Y_AFTER
+    assert robustness_report(y_true, y_before, y_after) == approx(
+        robustness_report(Y_TRUE, Y_BEFORE, Y_AFTER)
+    )
+
+    codes = LabelEncoder().transform(torch.tensor([3, 1, 3]))
+
+    assert codes.tolist() == [1, 0, 1]
+
+
+def test_encode_reference():
+    encoder = LabelEncoder()
+    reference = encoder.encode_reference(np.asarray(Y_TRUE), Y_BEFORE)
+    y_after = np.asarray(Y_AFTER)
+
+    assert robustness_report(*reference, encoder.transform(y_after)) == approx(
+        robustness_report(Y_TRUE, Y_BEFORE, Y_AFTER)
+    )
+
+    y_after[:] = "Inform"
+
+    assert encoder.inverse_transform(encoder.transform(y_after)) == ["Inform"] * 6
+    assert robustness_report(*reference, encoder.transform(y_after)) == approx(
+        robustness_report(Y_TRUE, Y_BEFORE, ["Inform"] * 6)
+    )
+
+
+def test_encode_2d():
+    y_after = [Y_AFTER, Y_BEFORE]
+    expected = batch_transition_counts(Y_TRUE, Y_BEFORE, y_after)
+
+    for column in [y_after, np.asarray(y_after)]:
+        encoder = LabelEncoder()
+        reference = encoder.encode_reference(Y_TRUE, Y_BEFORE)
+        codes = encoder.transform(column)
+
+        assert codes.shape == (2, 6)
+        assert (batch_transition_counts(*reference, codes) == expected).all()
@@ -0,0 +1,46 @@
+import numpy as np
+from bteval import (
+    load_columns,
+    load_labels,
+    r123_score,
+    robustness_report,
+    save_columns,
+    transition_codes,
+    transition_counts,
+)
+from pytest import approx
+
+from .data import X_AFTER, X_BEFORE, Y_AFTER, Y_BEFORE, Y_TRUE
+
+
+def test_save_columns(tmp_path):
+    save_columns(tmp_path, Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+    columns = load_columns(tmp_path)
+
+    assert isinstance(columns["y_true"], np.memmap)
+    assert [load_labels(tmp_path)[code] for code in columns["y_after"]] == Y_AFTER
+    assert r123_score(**columns) == approx(
+        r123_score(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+    )
+
+
+def test_save_columns_without_texts(tmp_path):
+    save_columns(tmp_path, Y_TRUE, Y_BEFORE, Y_AFTER)
+    columns = load_columns(tmp_path)
+
+    assert columns["x_before"] is None and columns["x_after"] is None
+    assert robustness_report(**columns) == approx(
+        robustness_report(Y_TRUE, Y_BEFORE, Y_AFTER)
+    )
+
+
+def test_chunks(tmp_path):
+    rng = np.random.default_rng(0)
+    y_true, y_before, y_after = rng.integers(0, 3, (3, (1 << 20) + 5))
+
+    save_columns(tmp_path, y_true, y_before, y_after)
+    codes = transition_codes(y_true, y_before, y_after)
+
+    assert transition_counts(**load_columns(tmp_path)) == tuple(
+        np.bincount(codes, minlength=5).tolist()
+    )
@@ -1,7 +1,37 @@
 import numpy as np
 import torch
-from bteval import r1_score, r12_score, r13_score, r13p_score, r123_score, r123p_score
-from pytest import approx, warns
+from bteval import (
+    C_CONST,
+    C_TO_I,
+    I_CONST,
+    I_TO_C,
+    I_TO_I,
+    MEASURES,
+    NON_ROBUST,
+    ROBUST,
+    Measure,
+    c_const_count,
+    c_to_i_count,
+    changed_count,
+    const_count,
+    i_const_count,
+    i_to_c_count,
+    i_to_i_count,
+    measure_score,
+    profile_stages,
+    r1_score,
+    r12_score,
+    r13_score,
+    r13p_score,
+    r123_score,
+    r123p_score,
+    robustness_breakdown,
+    robustness_report,
+    transition_codes,
+    transition_counts,
+)
+from bteval.metrics import r13_non_robust_case, r13_robust_case, score_robustness
+from pytest import approx, raises, warns
 
 
 def test_r1_score():
@@ -561,3 +591,354 @@ def test_torch():
     y_after = torch.tensor([1, 3, 3])
 
     assert r1_score(y_true, y_before, y_after) == approx(0.5)
+
+
+def test_transition_counts():
+    assert transition_counts(
+        ["Inform", "Request", "Inform", "Inform", "Deny"],
+        ["Inform", "Request", "Request", "Request", "Inform"],
+        ["Inform", "Confirm", "Request", "Confirm", "Deny"],
+    ) == (1, 1, 1, 1, 1)
+
+    assert transition_counts(
+        ["Inform", "Request", "Inform", "Inform", "Deny"],
+        ["Inform", "Request", "Request", "Request", "Inform"],
+        ["Inform", "Confirm", "Request", "Confirm", "Deny"],
+        ["a", "b", "c", "d", "e"],
+        ["a", "x", "c", "y", "z"],
+    ) == (0, 0, 1, 1, 1)
+
+
+def test_robustness_report():
+    y_true = ["Inform", "Request", "Inform", "Inform", "Deny", "Inform"]
+    y_before = ["Inform", "Request", "Request", "Request", "Inform", "Inform"]
+    y_after = ["Inform", "Confirm", "Request", "Confirm", "Deny", "Inform"]
+    x_before = ["a", "b", "c", "d", "e", "f"]
+    x_after = ["a", "x", "c", "y", "z", "w"]
+
+    for args in [
+        (y_true, y_before, y_after),
+        (y_true, y_before, y_after, x_before, x_after),
+    ]:
+        report = robustness_report(*args)
+
+        for name, func in [
+            ("r1_score", r1_score),
+            ("r12_score", r12_score),
+            ("r13_score", r13_score),
+            ("r13p_score", r13p_score),
+            ("r123_score", r123_score),
+            ("r123p_score", r123p_score),
+        ]:
+            assert report[name] == approx(func(*args))
+
+    report = robustness_report(y_true, y_before, y_after)
+
+    for name, func in [
+        ("c_to_i_count", c_to_i_count),
+        ("i_to_i_count", i_to_i_count),
+        ("i_to_c_count", i_to_c_count),
+        ("changed_count", changed_count),
+        ("i_const_count", i_const_count),
+        ("c_const_count", c_const_count),
+        ("const_count", const_count),
+    ]:
+        assert report[name] == func(y_true, y_before, y_after)
+
+
+def test_numpy_transition_counts():
+    rng = np.random.default_rng(0)
+    labels = np.asarray(["Inform", "Request", "Confirm", "Deny"])
+    y_true = labels[rng.integers(0, 4, 1000)]
+    y_before = labels[rng.integers(0, 4, 1000)]
+    y_after = labels[rng.integers(0, 4, 1000)]
+    x_before = rng.integers(0, 3, 1000).astype(str)
+    x_after = rng.integers(0, 3, 1000).astype(str)
+
+    assert transition_counts(y_true, y_before, y_after) == transition_counts(
+        y_true.tolist(), y_before.tolist(), y_after.tolist()
+    )
+    assert transition_counts(
+        y_true, y_before, y_after, x_before, x_after
+    ) == transition_counts(
+        y_true.tolist(),
+        y_before.tolist(),
+        y_after.tolist(),
+        x_before.tolist(),
+        x_after.tolist(),
+    )
+    assert c_to_i_count(y_true, y_before, y_after) == c_to_i_count(
+        y_true.tolist(), y_before.tolist(), y_after.tolist()
+    )
+    assert all(
+        type(count) is int for count in transition_counts(y_true, y_before, y_after)
+    )
+    assert type(c_to_i_count(y_true, y_before, y_after)) is int
+
+    with raises(ValueError):
+        transition_counts(
+            np.asarray([[1, 2]]), np.asarray([[1, 2]]), np.asarray([[1, 3]])
+        )
+
+
+def test_torch_transition_counts():
+    generator = torch.Generator().manual_seed(0)
+    y_true = torch.randint(0, 4, (1000,), generator=generator)
+    y_before = torch.randint(0, 4, (1000,), generator=generator)
+    y_after = torch.randint(0, 4, (1000,), generator=generator)
+    x_before = torch.randint(0, 3, (1000,), generator=generator).tolist()
+    x_after = torch.randint(0, 3, (1000,), generator=generator).tolist()
+
+    assert transition_counts(y_true, y_before, y_after) == transition_counts(
+        y_true.tolist(), y_before.tolist(), y_after.tolist()
+    )
+    assert transition_counts(
+        y_true, y_before, y_after, x_before, x_after
+    ) == transition_counts(
+        y_true.tolist(), y_before.tolist(), y_after.tolist(), x_before, x_after
+    )
+
+
+def test_weighted_transition_counts():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 4, 1000)
+    y_before = rng.integers(0, 4, 1000)
+    y_after = rng.integers(0, 4, 1000)
+    x_before = rng.integers(0, 3, 1000)
+    x_after = rng.integers(0, 3, 1000)
+    weights = rng.integers(0, 5, 1000)
+    repeated = [np.repeat(c, weights) for c in (y_true, y_before, y_after)]
+    text = [np.repeat(c, weights) for c in (x_before, x_after)]
+
+    for columns in [
+        (y_true.tolist(), y_before.tolist(), y_after.tolist()),
+        (y_true, y_before, y_after),
+        (torch.as_tensor(y_true), torch.as_tensor(y_before), torch.as_tensor(y_after)),
+    ]:
+        assert transition_counts(
+            *columns, sample_weight=weights.tolist()
+        ) == transition_counts(*repeated)
+        assert transition_counts(
+            *columns, x_before.tolist(), x_after.tolist(), weights.tolist()
+        ) == transition_counts(*repeated, *text)
+
+        with profile_stages():
+            assert transition_counts(
+                *columns, x_before, x_after, weights
+            ) == transition_counts(*repeated, *text)
+
+    assert score_robustness(
+        r13_robust_case,
+        r13_non_robust_case,
+        y_true.tolist(),
+        y_before.tolist(),
+        y_after.tolist(),
+        x_before.tolist(),
+        x_after.tolist(),
+        "warn",
+        weights.tolist(),
+    ) == approx(r13_score(*repeated, *text))
+
+
+def test_float_sample_weight():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 1000)
+    y_before = rng.integers(0, 2, 1000)
+    y_after = rng.integers(0, 2, 1000)
+    weights = rng.random(1000)
+
+    for columns in [
+        (y_true, y_before, y_after),
+        (torch.as_tensor(y_true), torch.as_tensor(y_before), torch.as_tensor(y_after)),
+    ]:
+        assert transition_counts(*columns, sample_weight=weights)[I_TO_I] == 0
+        assert i_to_i_count(*columns, sample_weight=weights) == 0
+
+
+def test_sample_weight():
+    y_true = np.asarray(["Inform", "Request", "Inform", "Inform", "Deny", "Inform"])
+    y_before = np.asarray(
+        ["Inform", "Request", "Request", "Request", "Inform", "Inform"]
+    )
+    y_after = np.asarray(["Inform", "Confirm", "Request", "Confirm", "Deny", "Inform"])
+    x_before = np.asarray(["a", "b", "c", "d", "e", "f"])
+    x_after = np.asarray(["a", "x", "c", "y", "z", "w"])
+    groups = np.asarray(["x", "y", "x", "y", "x", "y"])
+    weights = np.asarray([0.5, 2.0, 1.5, 1.0, 3.0, 0.5])
+    repeats = np.asarray([1, 4, 3, 2, 6, 1])
+    repeated = [np.repeat(c, repeats) for c in (y_true, y_before, y_after)]
+    text = [np.repeat(c, repeats) for c in (x_before, x_after)]
+
+    for func in [r1_score, r12_score, r13_score, r13p_score, r123_score, r123p_score]:
+        assert func(
+            y_true, y_before, y_after, x_before, x_after, sample_weight=weights
+        ) == approx(func(*repeated, *text))
+        assert func(
+            y_true.tolist(),
+            y_before.tolist(),
+            y_after.tolist(),
+            sample_weight=weights.tolist(),
+        ) == approx(func(*repeated))
+
+    for func in [
+        c_to_i_count,
+        i_to_i_count,
+        i_to_c_count,
+        changed_count,
+        i_const_count,
+        c_const_count,
+        const_count,
+    ]:
+        assert func(y_true, y_before, y_after, weights) == approx(func(*repeated) / 2)
+
+    assert measure_score(
+        "r13", y_true, y_before, y_after, sample_weight=repeats
+    ) == approx(r13_score(*repeated))
+
+    for columns in [
+        (y_true, y_before, y_after, groups),
+        (y_true.tolist(), y_before.tolist(), y_after.tolist(), groups.tolist()),
+    ]:
+        breakdown = robustness_breakdown(
+            *columns, x_before, x_after, zero_division=0.0, sample_weight=repeats
+        )
+
+        assert breakdown == robustness_breakdown(
+            *repeated, np.repeat(groups, repeats), *text, zero_division=0.0
+        )
+
+
+def test_torch_text_columns():
+    generator = torch.Generator().manual_seed(0)
+    y_true, y_before, y_after, x_before, x_after = torch.randint(
+        0, 3, (5, 1000), generator=generator
+    )
+    expected = transition_counts(
+        y_true.tolist(),
+        y_before.tolist(),
+        y_after.tolist(),
+        x_before.tolist(),
+        x_after.tolist(),
+    )
+
+    assert transition_counts(y_true, y_before, y_after, x_before, x_after) == expected
+    assert (
+        transition_counts(y_true, y_before, y_after, x_before.numpy(), x_after.numpy())
+        == expected
+    )
+    assert (
+        transition_codes(y_true, y_before, y_after, x_before, x_after).tolist()
+        == transition_codes(
+            y_true.tolist(),
+            y_before.tolist(),
+            y_after.tolist(),
+            x_before.tolist(),
+            x_after.tolist(),
+        ).tolist()
+    )
+
+
+def test_torch_logits():
+    y_true = torch.tensor([1, 2, 1])
+    y_before = torch.tensor(
+        [[0.1, 0.8, 0.1, 0.0], [0.1, 0.1, 0.7, 0.1], [0.0, 0.1, 0.9, 0.0]]
+    )
+    y_after = torch.tensor(
+        [[0.1, 0.8, 0.1, 0.0], [0.1, 0.1, 0.1, 0.7], [0.0, 0.1, 0.0, 0.9]]
+    )
+
+    assert r1_score(y_true, y_before, y_after) == approx(0.5)
+
+
+def test_robustness_breakdown():
+    y_true = ["Inform", "Request", "Inform", "Inform", "Deny", "Inform", "Deny"]
+    y_before = ["Inform", "Request", "Request", "Request", "Inform", "Inform", "Deny"]
+    y_after = ["Inform", "Confirm", "Request", "Confirm", "Deny", "Inform", "Deny"]
+    x_before = ["a", "b", "c", "d", "e", "f", "g"]
+    x_after = ["a", "x", "c", "y", "z", "w", "g"]
+    groups = ["en", "pl", "en", "pl", "pl", "en", "de"]
+
+    for array in [list, np.asarray]:
+        breakdown = robustness_breakdown(
+            array(y_true),
+            array(y_before),
+            array(y_after),
+            array(groups),
+            array(x_before),
+            array(x_after),
+            zero_division=1.0,
+        )
+
+        assert sorted(breakdown) == ["de", "en", "pl"]
+        assert breakdown["de"]["r1_score"] == 1.0
+        assert breakdown["de"]["const_count"] == 0
+
+        for group in ["en", "pl"]:
+            indices = [i for i, g in enumerate(groups) if g == group]
+            assert breakdown[group] == approx(
+                robustness_report(
+                    [y_true[i] for i in indices],
+                    [y_before[i] for i in indices],
+                    [y_after[i] for i in indices],
+                    [x_before[i] for i in indices],
+                    [x_after[i] for i in indices],
+                    zero_division=1.0,
+                )
+            )
+
+
+def test_measure():
+    y_true = ["Inform", "Request", "Inform", "Inform", "Deny", "Inform"]
+    y_before = ["Inform", "Request", "Request", "Request", "Inform", "Inform"]
+    y_after = ["Inform", "Confirm", "Request", "Confirm", "Deny", "Inform"]
+
+    r13 = Measure({"constC": ROBUST, "C->I": NON_ROBUST, "I->C": NON_ROBUST})
+
+    assert r13.table == MEASURES["r13"].table
+    assert measure_score(r13, y_true, y_before, y_after) == approx(
+        r13_score(y_true, y_before, y_after)
+    )
+    assert measure_score("r13", np.asarray(y_true), y_before, y_after) == approx(
+        r13_score(y_true, y_before, y_after)
+    )
+    assert score_robustness(
+        r13.robust_case,
+        r13.non_robust_case,
+        y_true,
+        y_before,
+        y_after,
+        None,
+        None,
+        zero_division="warn",
+    ) == approx(
+        score_robustness(
+            r13_robust_case,
+            r13_non_robust_case,
+            y_true,
+            y_before,
+            y_after,
+            None,
+            None,
+            zero_division="warn",
+        )
+    )
+    assert r13.outcomes(
+        np.asarray([C_CONST, I_CONST, C_TO_I, I_TO_I, I_TO_C])
+    ).tolist() == [
+        1,
+        0,
+        -1,
+        0,
+        -1,
+    ]
+
+    # robust: constI, non-robust: I->I
+    stable_errors = Measure({I_CONST: ROBUST, I_TO_I: NON_ROBUST})
+
+    assert measure_score(stable_errors, y_true, y_before, y_after) == approx(1 / 2)
+
+    with raises(ValueError):
+        Measure({"X->Y": ROBUST})
+
+    with raises(ValueError):
+        Measure({C_CONST: "good"})
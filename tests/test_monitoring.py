@@ -0,0 +1,107 @@
+from bteval import (
+    DecayedRobustnessEstimator,
+    RobustnessWindow,
+    r1_score,
+    robustness_report,
+    transition_counts,
+)
+from pytest import approx, raises
+
+from .data import X_AFTER, X_BEFORE, Y_AFTER, Y_BEFORE, Y_TRUE
+
+
+def test_count_window():
+    window = RobustnessWindow(size=3)
+
+    for i in range(len(Y_TRUE)):
+        window.add(Y_TRUE[i], Y_BEFORE[i], Y_AFTER[i])
+        start = max(0, i - 2)
+
+        assert len(window) == i + 1 - start
+        assert tuple(window.counts) == transition_counts(
+            Y_TRUE[start : i + 1], Y_BEFORE[start : i + 1], Y_AFTER[start : i + 1]
+        )
+
+    assert window.score("r1") == approx(r1_score(Y_TRUE[3:], Y_BEFORE[3:], Y_AFTER[3:]))
+
+
+def test_time_window():
+    window = RobustnessWindow(duration=10)
+    window.update(
+        Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER, timestamps=range(0, 60, 10)
+    )
+
+    assert len(window) == 1
+    assert window.report(now=55) == approx(
+        robustness_report(Y_TRUE[5:], Y_BEFORE[5:], Y_AFTER[5:])
+    )
+    assert window.score("r1", zero_division=1.0, now=60) == 1.0
+    assert len(window) == 0
+
+
+def test_growing_window():
+    window = RobustnessWindow(duration=1000)
+    y_true, y_before, y_after = Y_TRUE * 350, Y_BEFORE * 350, Y_AFTER * 350
+
+    window.update(y_true[:900], y_before[:900], y_after[:900], timestamps=range(900))
+    window.update(
+        y_true[900:],
+        y_before[900:],
+        y_after[900:],
+        timestamps=[1500 + i / 10 for i in range(1200)],
+    )
+
+    assert len(window) == 1480
+    assert tuple(window.counts) == transition_counts(
+        y_true[620:], y_before[620:], y_after[620:]
+    )
+    assert window.report(now=1619.9) == approx(
+        robustness_report(y_true[620:], y_before[620:], y_after[620:])
+    )
+
+
+def test_invalid_window():
+    for kwargs in [{}, {"size": 0}, {"size": -1}, {"duration": 0}, {"duration": -1.0}]:
+        with raises(ValueError):
+            RobustnessWindow(**kwargs)
+
+
+def test_decayed_estimator():
+    estimator = DecayedRobustnessEstimator(half_life=1)
+
+    # C->I, then constC twice
+    estimator.add("Inform", "Inform", "Deny")
+    estimator.add("Inform", "Inform", "Inform")
+    estimator.add("Inform", "Inform", "Inform")
+
+    assert estimator.counts[2] == approx(0.25)
+    assert estimator.score("r1") == approx(1.5 / 1.75)
+
+    estimator.add("Inform", "Inform", "Inform", "a", "a")
+
+    assert estimator.score("r1") == approx(1.5 / 1.75)
+
+
+def test_decayed_estimator_timestamps():
+    estimator = DecayedRobustnessEstimator(half_life=10)
+    estimator.update(
+        ["Inform", "Inform"],
+        ["Inform", "Inform"],
+        ["Deny", "Inform"],
+        timestamps=[0, 20],
+    )
+
+    assert estimator.counts[2] == approx(0.25)
+    assert estimator.report()["r1_score"] == approx(1 / 1.25)
+
+    with raises(ValueError):
+        DecayedRobustnessEstimator(half_life=0)
+
+
+def test_decayed_estimator_without_decay():
+    estimator = DecayedRobustnessEstimator(half_life=float("inf"))
+    estimator.update(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+
+    assert estimator.report() == approx(
+        robustness_report(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+    )
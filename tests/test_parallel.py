@@ -0,0 +1,38 @@
+from bteval import (
+    parallel_file_transition_counts,
+    parallel_robustness_report,
+    parallel_transition_counts,
+    robustness_report,
+    transition_counts,
+)
+from pytest import approx
+
+Y_TRUE = ["Inform", "Request", "Inform", "Inform", "Deny", "Inform", "Deny"]
+Y_BEFORE = ["Inform", "Request", "Request", "Request", "Inform", "Inform", "Deny"]
+Y_AFTER = ["Inform", "Confirm", "Request", "Confirm", "Deny", "Inform", "Request"]
+X_BEFORE = ["a", "b", "c", "d", "e", "f", "g"]
+X_AFTER = ["a", "x", "c", "y", "z", "w", "g"]
+
+
+def load_shard(path):
+    start, stop = path
+
+    return Y_TRUE[start:stop], Y_BEFORE[start:stop], Y_AFTER[start:stop]
+
+
+def test_parallel_transition_counts():
+    assert parallel_transition_counts(
+        Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER, n_jobs=2, shard_size=3
+    ) == transition_counts(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+
+
+def test_parallel_file_transition_counts():
+    assert parallel_file_transition_counts(
+        [(0, 2), (2, 5), (5, 7)], load_shard, n_jobs=2
+    ) == transition_counts(Y_TRUE, Y_BEFORE, Y_AFTER)
+
+
+def test_parallel_robustness_report():
+    assert parallel_robustness_report(
+        Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER, n_jobs=2
+    ) == approx(robustness_report(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER))
@@ -0,0 +1,84 @@
+import numpy as np
+import torch
+from bteval import profile_stages, r1_score, robustness_report
+from bteval.metrics import r1_non_robust_case, r1_robust_case, score_robustness
+from pytest import approx
+
+from .data import X_AFTER, X_BEFORE, Y_AFTER, Y_BEFORE, Y_TRUE
+
+
+def test_profile_stages():
+    for array in [list, np.asarray]:
+        with profile_stages() as events:
+            score = r1_score(
+                array(Y_TRUE),
+                array(Y_BEFORE),
+                array(Y_AFTER),
+                array(X_BEFORE),
+                array(X_AFTER),
+            )
+
+        assert score == approx(r1_score(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER))
+        assert [event.stage for event in events] == [
+            "convert",
+            "filter",
+            "tally",
+            "aggregate",
+        ]
+        assert events[1].n_samples == 4 and events[1].n_removed == 2
+        assert all(event.seconds >= 0 for event in events)
+
+    with profile_stages() as events:
+        r1_score(
+            Y_TRUE,
+            Y_BEFORE,
+            Y_AFTER,
+            X_BEFORE,
+            X_AFTER,
+            sample_weight=[2, 1, 3, 1, 1, 1],
+        )
+
+    assert events[1].n_samples == 4 and events[1].n_removed == 2
+
+
+def test_profile_torch():
+    with profile_stages() as events:
+        report = robustness_report(
+            torch.tensor([1, 2, 1]),
+            torch.tensor([1, 2, 2]),
+            torch.tensor([1, 3, 3]),
+            X_BEFORE[:3],
+            X_AFTER[:3],
+        )
+
+    assert report["c_to_i_count"] == 1
+    assert events[1].n_removed == 2
+    assert [event.stage for event in events].count("aggregate") == 6
+
+
+def test_profile_score_robustness():
+    events = []
+
+    with profile_stages(events.append):
+        score_robustness(
+            r1_robust_case,
+            r1_non_robust_case,
+            Y_TRUE,
+            Y_BEFORE,
+            Y_AFTER,
+            X_BEFORE,
+            X_AFTER,
+            zero_division="warn",
+        )
+
+    assert [event.stage for event in events] == ["filter", "tally", "aggregate"]
+    assert events[0].n_removed == 2
+
+
+def test_profile_disabled():
+    with profile_stages() as events:
+        pass
+
+    r1_score(Y_TRUE, Y_BEFORE, Y_AFTER)
+
+    assert events == []
@@ -0,0 +1,47 @@
+import numpy as np
+from bteval import RobustnessReference, TextNormalizer, r13_score, robustness_report
+from pytest import approx, raises
+
+from .data import X_BEFORE, Y_BEFORE, Y_TRUE
+
+Y_AFTER = [
+    ["Inform", "Confirm", "Request", "Confirm", "Deny", "Inform"],
+    ["Inform", "Request", "Inform", "Confirm", "Deny", "Request"],
+]
+X_AFTER = [
+    ["a", "x", "c", "y", "z", "w"],
+    ["x", "b", "y", "d", "z", "f"],
+]
+
+
+def test_reference():
+    reference = RobustnessReference(Y_TRUE, Y_BEFORE, X_BEFORE)
+
+    for y_after, x_after in zip(Y_AFTER, X_AFTER):
+        assert reference.report(y_after) == approx(
+            robustness_report(Y_TRUE, Y_BEFORE, y_after)
+        )
+        assert reference.report(np.asarray(y_after), x_after) == approx(
+            robustness_report(Y_TRUE, Y_BEFORE, y_after, X_BEFORE, x_after)
+        )
+        assert reference.score("r13", y_after, x_after) == approx(
+            r13_score(Y_TRUE, Y_BEFORE, y_after, X_BEFORE, x_after)
+        )
+
+    with raises(ValueError):
+        reference.transition_counts(Y_AFTER[0][:3])
+
+    assert reference.x_before.dtype == np.int64
+
+
+def test_reference_normalizer():
+    reference = RobustnessReference(
+        Y_TRUE,
+        Y_BEFORE,
+        [x.upper() + "." for x in X_BEFORE],
+        normalizer=TextNormalizer(),
+    )
+
+    assert reference.report(Y_AFTER[0], X_AFTER[0]) == approx(
+        robustness_report(Y_TRUE, Y_BEFORE, Y_AFTER[0], X_BEFORE, X_AFTER[0])
+    )
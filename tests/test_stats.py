@@ -0,0 +1,122 @@
+import math
+
+import numpy as np
+from bteval import (
+    bootstrap_robustness,
+    bootstrap_transition_counts,
+    paired_permutation_test,
+    r1_score,
+    robustness_report,
+)
+from pytest import approx, warns
+
+
+def test_bootstrap_robustness():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 4, 10000)
+    y_before = np.where(rng.random(10000) < 0.8, y_true, rng.integers(0, 4, 10000))
+    y_after = np.where(rng.random(10000) < 0.8, y_before, rng.integers(0, 4, 10000))
+
+    report = robustness_report(y_true, y_before, y_after)
+    intervals = bootstrap_robustness(
+        y_true, y_before, y_after, n_resamples=2000, random_state=0
+    )
+
+    assert intervals == bootstrap_robustness(
+        y_true, y_before, y_after, n_resamples=2000, random_state=0
+    )
+
+    for name, (low, high) in intervals.items():
+        assert low <= report[name] <= high
+        assert high - low < 0.05
+
+
+def test_bootstrap_zero_division():
+    intervals = bootstrap_transition_counts((0, 0, 0, 3, 0), random_state=0)
+
+    assert (
+        all(math.isnan(low) and math.isnan(high) for low, high in intervals.values())
+        is False
+    )
+    assert all(math.isnan(v) for v in intervals["r1_score"])
+    assert intervals["r12_score"] == (0.0, 0.0)
+
+
+def test_paired_permutation_test():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 4, 20000)
+    y_before = np.where(rng.random(20000) < 0.8, y_true, rng.integers(0, 4, 20000))
+    y_after_a = np.where(rng.random(20000) < 0.8, y_before, rng.integers(0, 4, 20000))
+    y_after_b = np.where(rng.random(20000) < 0.8, y_before, rng.integers(0, 4, 20000))
+    y_after_c = np.where(rng.random(20000) < 0.7, y_before, rng.integers(0, 4, 20000))
+
+    result = paired_permutation_test(
+        "r1", y_true, y_before, y_after_a, y_after_b, n_resamples=2000, random_state=0
+    )
+
+    assert result["score_a"] == approx(r1_score(y_true, y_before, y_after_a))
+    assert result["score_b"] == approx(r1_score(y_true, y_before, y_after_b))
+    assert result["difference"] == approx(result["score_b"] - result["score_a"])
+    assert result["p_value"] > 0.01
+
+    result = paired_permutation_test(
+        "r1", y_true, y_before, y_after_a, y_after_c, n_resamples=2000, random_state=0
+    )
+
+    assert result["difference"] < 0
+    assert result["p_value"] < 0.01
+
+
+def test_paired_permutation_test_texts():
+    y_true = ["Inform", "Request", "Inform", "Inform"]
+    y_before = ["Inform", "Request", "Inform", "Inform"]
+    y_after_a = ["Inform", "Deny", "Deny", "Inform"]
+    x_before = ["a", "b", "c", "d"]
+    x_after_a = ["a", "x", "y", "z"]
+
+    result = paired_permutation_test(
+        "r1",
+        y_true,
+        y_before,
+        y_after_a,
+        y_after_a,
+        x_before,
+        x_after_a,
+        x_before,
+        random_state=0,
+        zero_division=0.0,
+    )
+
+    assert result["score_a"] == approx(
+        r1_score(y_true, y_before, y_after_a, x_before, x_after_a)
+    )
+    assert result["score_b"] == 0.0
+    assert 0 < result["p_value"] <= 1
+
+
+def test_paired_permutation_test_undefined():
+    y_true = [1, 1]
+    y_before = [2, 2]
+    y_after_a = [1, 2]
+    y_after_b = [3, 1]
+
+    with warns(UserWarning):
+        result = paired_permutation_test(
+            "r13", y_true, y_before, y_after_a, y_after_b, random_state=0
+        )
+
+    assert result["difference"] == 0.0
+    assert result["p_value"] == 1.0
+
+    result = paired_permutation_test(
+        "r13",
+        y_true,
+        y_before,
+        y_after_a,
+        y_after_b,
+        random_state=0,
+        zero_division=1.0,
+    )
+
+    assert result["score_a"] == result["score_b"] == 0.0
+    assert result["p_value"] == 1.0
@@ -0,0 +1,33 @@
+from bteval import RobustnessAccumulator, r13_score, robustness_report
+from pytest import approx
+
+from .data import X_AFTER, X_BEFORE, Y_AFTER, Y_BEFORE, Y_TRUE
+
+
+def test_update():
+    accumulator = RobustnessAccumulator()
+
+    for i in range(0, 6, 2):
+        accumulator.update(
+            Y_TRUE[i : i + 2],
+            Y_BEFORE[i : i + 2],
+            Y_AFTER[i : i + 2],
+            X_BEFORE[i : i + 2],
+            X_AFTER[i : i + 2],
+        )
+
+    assert accumulator.score("r13") == approx(
+        r13_score(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+    )
+    assert accumulator.report() == approx(
+        robustness_report(Y_TRUE, Y_BEFORE, Y_AFTER, X_BEFORE, X_AFTER)
+    )
+
+
+def test_merge():
+    left = RobustnessAccumulator().update(Y_TRUE[:4], Y_BEFORE[:4], Y_AFTER[:4])
+    right = RobustnessAccumulator().update(Y_TRUE[4:], Y_BEFORE[4:], Y_AFTER[4:])
+
+    assert right.merge(left).report() == approx(
+        robustness_report(Y_TRUE, Y_BEFORE, Y_AFTER)
+    )
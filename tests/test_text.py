@@ -0,0 +1,101 @@
+import pickle
+
+import numpy as np
+from bteval import (
+    RobustnessAccumulator,
+    TextNormalizer,
+    r1_score,
+    robustness_report,
+    transition_counts,
+)
+from bteval.metrics import (
+    r1_non_robust_case,
+    r1_robust_case,
+    remove_const_text_samples,
+    score_robustness,
+)
+from pytest import approx
+
+
+def test_normalize():
+    normalizer = TextNormalizer()
+
+    assert normalizer.normalize("  Book a table,  please! ") == "book a table please"
+    assert TextNormalizer(lowercase=False).normalize("Book it.") == "Book it"
+    assert TextNormalizer(strip_punctuation=False).normalize("Book it.") == "book it."
+
+
+def test_digests():
+    normalizer = TextNormalizer()
+    x_before = ["Book a table.", "Play music", "stop"]
+    x_after = ["book a table", "Play magic", "Stop!"]
+
+    digests = normalizer.digests(x_before)
+
+    assert all(isinstance(digest, int) for digest in digests)
+    assert digests == normalizer.digests(x_before)
+    assert [b == a for b, a in zip(digests, normalizer.digests(x_after))] == [
+        True,
+        False,
+        True,
+    ]
+
+    assert r1_score(
+        ["Inform", "Request", "Stop"],
+        ["Inform", "Request", "Stop"],
+        ["Deny", "Request", "Deny"],
+        digests,
+        normalizer.digests(x_after),
+    ) == approx(1.0)
+
+
+def test_remove_const_text_samples():
+    assert remove_const_text_samples(
+        ["Inform", "Request", "Stop"],
+        ["Inform", "Request", "Stop"],
+        ["Deny", "Request", "Deny"],
+        ["Book a table.", "Play music", "stop"],
+        ["book a table", "Play magic", "Stop!"],
+        normalizer=TextNormalizer(),
+    ) == (["Request"], ["Request"], ["Request"])
+
+
+def test_pickle():
+    normalizer = pickle.loads(pickle.dumps(TextNormalizer(lowercase=False)))
+
+    assert normalizer.digest("Stop") != normalizer.digest("stop")
+
+
+def test_scoring_normalizer():
+    y_true = ["Inform", "Request", "Stop"]
+    y_before = ["Inform", "Request", "Stop"]
+    y_after = ["Deny", "Request", "Deny"]
+    x_before = ["Book a table.", "Play music", "stop"]
+    x_after = ["book a table", "Play magic", "Stop!"]
+    normalizer = TextNormalizer()
+
+    for columns in [
+        (y_true, y_before, y_after),
+        (np.asarray(y_true), np.asarray(y_before), np.asarray(y_after)),
+    ]:
+        assert transition_counts(
+            *columns, x_before, x_after, normalizer=normalizer
+        ) == (1, 0, 0, 0, 0)
+
+    assert robustness_report(
+        y_true, y_before, y_after, x_before, x_after, normalizer=normalizer
+    )["r1_score"] == approx(1.0)
+    assert RobustnessAccumulator().update(
+        y_true, y_before, y_after, x_before, x_after, normalizer=normalizer
+    ).counts == [1, 0, 0, 0, 0]
+    assert score_robustness(
+        r1_robust_case,
+        r1_non_robust_case,
+        y_true,
+        y_before,
+        y_after,
+        x_before,
+        x_after,
+        "warn",
+        normalizer=normalizer,
+    ) == approx(1.0)
@@ -0,0 +1,132 @@
+import math
+
+import numpy as np
+from bteval import (
+    TextNormalizer,
+    robustness_by_wer,
+    robustness_report,
+    word_error_rates,
+    word_errors,
+)
+from pytest import approx, raises
+
+X_BEFORE = [
+    "turn on the lights",
+    "play some music",
+    "what is the weather",
+    "stop",
+    "set an alarm for seven",
+    "",
+]
+X_AFTER = [
+    "turn on the lights",
+    "play sum music",
+    "what is weather today",
+    "top it",
+    "set alarm",
+    "hello",
+]
+
+
+def _edit_distance(ref, hyp):
+    ref = ref.split()
+    hyp = hyp.split()
+    d = [
+        [i + j if i * j == 0 else 0 for j in range(len(hyp) + 1)]
+        for i in range(len(ref) + 1)
+    ]
+
+    for i in range(1, len(ref) + 1):
+        for j in range(1, len(hyp) + 1):
+            d[i][j] = min(
+                d[i - 1][j] + 1,
+                d[i][j - 1] + 1,
+                d[i - 1][j - 1] + (ref[i - 1] != hyp[j - 1]),
+            )
+
+    return d[-1][-1]
+
+
+def test_word_errors():
+    errors, lengths = word_errors(X_BEFORE, X_AFTER)
+
+    assert errors.tolist() == [0, 1, 2, 2, 3, 1]
+    assert lengths.tolist() == [4, 3, 4, 1, 5, 0]
+    assert word_error_rates(X_BEFORE, X_AFTER) == approx(
+        [0.0, 1 / 3, 0.5, 2.0, 0.6, 1.0]
+    )
+
+    normalizer = TextNormalizer()
+    errors, _ = word_errors(
+        [x.upper() + "." for x in X_BEFORE], X_AFTER, normalizer=normalizer
+    )
+
+    assert errors.tolist() == [0, 1, 2, 2, 3, 1]
+
+    with raises(ValueError):
+        word_errors(X_BEFORE, X_AFTER[:3])
+
+
+def test_word_errors_random():
+    rng = np.random.default_rng(0)
+    words = np.asarray(["a", "b", "c", "d"])
+    x_before = [
+        " ".join(words[rng.integers(0, 4, rng.integers(0, 8))]) for _ in range(300)
+    ]
+    x_after = [
+        " ".join(words[rng.integers(0, 4, rng.integers(0, 8))]) for _ in range(300)
+    ]
+    expected = [_edit_distance(xb, xa) for xb, xa in zip(x_before, x_after)]
+
+    assert word_errors(x_before, x_after)[0].tolist() == expected
+    assert (
+        word_errors(x_before, x_after, n_jobs=2, shard_size=64)[0].tolist() == expected
+    )
+
+
+def test_robustness_by_wer():
+    y_true = ["Inform", "Request", "Inform", "Inform", "Deny", "Inform"]
+    y_before = ["Inform", "Request", "Request", "Request", "Inform", "Inform"]
+    y_after = ["Inform", "Confirm", "Request", "Confirm", "Deny", "Request"]
+    breakdown = robustness_by_wer(
+        y_true, y_before, y_after, X_BEFORE, X_AFTER, bins=(0.4, 1.0), zero_division=0.0
+    )
+
+    assert list(breakdown) == [0.4, 1.0, math.inf]
+    assert breakdown[0.4] == robustness_report(
+        y_true[1:2], y_before[1:2], y_after[1:2], zero_division=0.0
+    )
+    assert breakdown[1.0] == robustness_report(
+        y_true[2:6:2] + y_true[5:],
+        y_before[2:6:2] + y_before[5:],
+        y_after[2:6:2] + y_after[5:],
+        zero_division=0.0,
+    )
+    assert breakdown[math.inf]["i_to_i_count"] == 1
+
+    weighted = robustness_by_wer(
+        y_true,
+        y_before,
+        y_after,
+        X_BEFORE,
+        X_AFTER,
+        bins=(0.4, 1.0),
+        zero_division=0.0,
+        sample_weight=[1, 2, 1, 1, 1, 1],
+    )
+
+    assert weighted[0.4]["c_to_i_count"] == 2
+
+    assert (
+        robustness_by_wer(
+            y_true,
+            y_before,
+            y_after,
+            tuple(X_BEFORE),
+            tuple(X_AFTER),
+            bins=(0.4, 1.0),
+            normalizer=TextNormalizer(),
+            zero_division=0.0,
+        )
+        == breakdown
+    )